@@ -0,0 +1,7 @@
+# advisor/__init__.py
+# Core logic of the Career & Education Advisor: data loading, ingestion, search,
+# facets, geo, timeline, sorting, export, quiz scoring and metrics.
+#
+# Nothing in this package imports Streamlit, so batch jobs, workers and the
+# benchmarks can use it directly. Submodules are imported on demand; pandas and
+# pyarrow are only pulled in by the modules that need them.
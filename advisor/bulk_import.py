@@ -0,0 +1,328 @@
+# advisor/bulk_import.py
+# Offline import of state-supplied college lists: normalize, block, fuzzy-match,
+# merge duplicates and write a versioned directory plus a merge report.
+#
+#   python -m advisor.bulk_import tn.csv kerala.parquet --with-current --install
+#
+# Rows are validated against COLLEGE_SCHEMA, then blocked by (state, district)
+# so only colleges in the same district are ever compared. District names are
+# matched on a phonetic key ("Chennai District" / "chennai", "Tiruvanantapuram" /
+# "Thiruvananthapuram"). Within a block, names are normalized (aliases such as
+# Govt -> Government, punctuation, trailing district name) and compared by
+# character-trigram Dice similarity; numbers in names must agree exactly, so
+# "College No. 1" never merges with "College No. 2". Blocks are matched in a
+# process pool. Each cluster of duplicates keeps its most complete row and
+# takes the union of its streams, courses and facilities.
+#
+# Each run writes IMPORTS_DIR/<timestamp>/ (colleges.parquet, merge_report.csv,
+# rejected_rows.csv, summary.json). --install swaps colleges.parquet in as the
+# app's Parquet store; running workers see a new source version and republish
+# their shared snapshot on the next rerun.
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from advisor.ingest import COLLEGE_SCHEMA, INGEST_MAX_ERRORS, validate_chunk
+from advisor.search import SEARCH_ALIASES, _phonetic_key
+from advisor.sources import COLLEGE_COLUMNS, COLLEGES_PATH, DATA_DIR, GEO_COLUMNS, active_source, store_path
+
+IMPORTS_DIR = os.environ.get("IMPORTS_DIR", os.path.join(DATA_DIR, "imports"))
+DEDUPE_THRESHOLD = 0.85      # trigram Dice similarity at which two names are the same college
+DEDUPE_MAX_BLOCK = 5000      # distinct names per block before it is split by first significant letter
+TASK_ROWS = 20_000           # rows per process-pool task
+# list columns and how merged lists are written back (matches data/colleges.csv)
+LIST_COLUMNS = {"streams": ",", "courses": "; ", "facilities": ", "}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_LIST_SPLIT_RE = re.compile(r"[,;|]")
+_NAME_STOPWORDS = {"of", "the", "and"}
+_DISTRICT_NOISE = {"district", "dist", "distt", "zila", "zilla", "jilla"}
+_GENERIC_WORDS = _NAME_STOPWORDS | {"government", "college", "institute", "university", "school", "degree"}
+
+def _words(text):
+    return [SEARCH_ALIASES.get(w, w) for w in _WORD_RE.findall(str(text).lower())]
+
+def clean_text(text):
+    return " ".join(str(text).split())
+
+def district_key(district):
+    """Blocking key for a district: words without "district"/"zila", phonetically folded."""
+    return _phonetic_key("".join(w for w in _words(district) if w not in _DISTRICT_NOISE))
+
+def name_key(name, district_words=()):
+    """Comparable form of a college name: folded words, no filler, no trailing district name."""
+    words = [w for w in _words(name) if w not in _NAME_STOPWORDS]
+    while len(words) > 1 and words[-1] in district_words:
+        words.pop()
+    return " ".join(words)
+
+def list_key(item):
+    return re.sub(r"[^a-z0-9]", "", item.lower())
+
+def split_list(text):
+    return [clean_text(x) for x in _LIST_SPLIT_RE.split(str(text)) if x.strip()]
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _fuzzy_pairs(keys, digits, threshold):
+    """(i, j, dice) for i < j among distinct `keys` whose trigram Dice is >= threshold."""
+    vocab, cols, rows = {}, [], []
+    for i, key in enumerate(keys):
+        for g in _trigrams(key):
+            cols.append(vocab.setdefault(g, len(vocab)))
+            rows.append(i)
+    x = np.zeros((len(keys), len(vocab)), dtype=np.float32)
+    x[rows, cols] = 1.0
+    sizes = x.sum(axis=1)
+    found = []
+    for start in range(0, len(keys), 1024):
+        shared = x[start:start + 1024] @ x.T
+        dice = 2 * shared / (sizes[start:start + 1024, None] + sizes[None, :])
+        i, j = np.nonzero(dice >= threshold)
+        i += start
+        keep = (j > i) & (digits[i] == digits[j])
+        found.append((i[keep], j[keep], dice[i[keep] - start, j[keep]]))
+    return tuple(np.concatenate(parts) for parts in zip(*found)) if found else (np.empty(0, int),) * 3
+
+def _match_block(rows, names, district_words, threshold):
+    """Duplicate links (row, row, score) within one block; score 1.0 means identical normalized names."""
+    keys = [name_key(n, district_words) for n in names]
+    first = {}
+    links = []
+    for row, key in zip(rows.tolist(), keys):
+        if key in first:
+            links.append((first[key], row, 1.0))
+        else:
+            first[key] = row
+    unique = list(first)
+    if len(unique) < 2:
+        return links
+    # oversized blocks are compared in parts that share the first letter of the first significant word
+    parts = {}
+    for key in unique:
+        significant = [w for w in key.split() if w not in _GENERIC_WORDS]
+        parts.setdefault(significant[0][0] if significant and len(unique) > DEDUPE_MAX_BLOCK else "", []).append(key)
+    for part in parts.values():
+        digits = pd.factorize(pd.Series([" ".join(w for w in k.split() if w.isdigit()) for k in part]))[0]
+        for i, j, score in zip(*_fuzzy_pairs(part, digits, threshold)):
+            if score < 1.0:
+                links.append((first[part[i]], first[part[j]], float(score)))
+    return links
+
+def _match_task(blocks, threshold):
+    links = []
+    for rows, names, district_words in blocks:
+        links.extend(_match_block(rows, names, district_words, threshold))
+    return links
+
+def _clusters(n, links):
+    """Cluster id per row (the smallest row in its cluster) and each row's strongest link score."""
+    parent = np.arange(n)
+
+    def find(a):
+        root = a
+        while parent[root] != root:
+            root = parent[root]
+        while parent[a] != root:
+            parent[a], a = root, parent[a]
+        return root
+
+    score = np.zeros(n)
+    for a, b, s in links:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+        score[a], score[b] = max(score[a], s), max(score[b], s)
+    return np.array([find(i) for i in range(n)]), score
+
+def read_lists(paths, progress=print):
+    """Validated rows from every input, with `source` and `line` columns.
+
+    Returns (rows, errors, rejected, truncated): at most INGEST_MAX_ERRORS row errors, the
+    number of rejected rows, and whether some rejected rows are missing from the errors.
+    """
+    frames, errors, rejected = [], [], 0
+    for path in paths:
+        if path.endswith((".parquet", ".pq")):
+            chunks = [pd.read_parquet(path).astype("string")]
+        else:
+            chunks = pd.read_csv(path, dtype="string", chunksize=200_000, keep_default_na=False)
+        for chunk in chunks:
+            good, bad = validate_chunk(chunk, COLLEGE_SCHEMA)
+            frames.append(good.assign(source=os.path.basename(path), line=good.index.to_numpy() + 2))
+            rejected += len(chunk) - len(good)
+            errors.extend({"source": os.path.basename(path), **e} for e in bad[:INGEST_MAX_ERRORS - len(errors)])
+        progress(f"read {path}")
+    rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=list(COLLEGE_SCHEMA["columns"]))
+    errors = pd.DataFrame(errors, columns=["source", "line", "column", "value", "error"])
+    # validate_chunk caps its own errors too, so count the rejected rows the report covers
+    return rows, errors, rejected, len(errors.drop_duplicates(["source", "line"])) < rejected
+
+def _canonical(spellings, keys):
+    """Most common spelling per key, applied to every spelling."""
+    counts = pd.DataFrame({"key": keys, "text": spellings}).value_counts(sort=True)
+    best = counts.reset_index().drop_duplicates("key").set_index("key")["text"]
+    return pd.Series(keys).map(best).to_numpy()
+
+def _join_groups(groups, texts, joiner):
+    """joiner-joined texts per run of equal `groups` (already contiguous), indexed by group."""
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) else np.empty(0, int)
+    ends = np.r_[starts[1:], len(groups)]
+    return pd.Series([joiner.join(texts[a:b]) for a, b in zip(starts.tolist(), ends.tolist())], index=groups[starts], dtype=object)
+
+def merge_colleges(rows, threshold=DEDUPE_THRESHOLD, workers=None, progress=print):
+    """Deduplicate validated rows. Returns (directory, merge report)."""
+    rows = rows.reset_index(drop=True)
+    n = len(rows)
+    for col in COLLEGE_COLUMNS:  # plain Python strings: everything below is per-string work
+        rows[col] = rows[col].fillna("").astype(str).to_numpy(dtype=object)
+    for col in ("college_name", "district", "state"):
+        rows[col] = rows[col].map(clean_text)
+    # normalize state and district spellings to the most common one per key
+    state_keys = rows["state"].str.lower().to_numpy()
+    rows["state"] = _canonical(rows["state"].to_numpy(), state_keys)
+    unique_districts = pd.unique(rows["district"])
+    dkeys = pd.Series(rows["district"]).map({d: district_key(d) for d in unique_districts}).to_numpy()
+    block_keys = pd.Series(state_keys, dtype=object) + "|" + pd.Series(dkeys, dtype=object)
+    rows["district"] = _canonical(rows["district"].to_numpy(), block_keys.to_numpy())
+
+    codes = pd.factorize(block_keys)[0]
+    order = np.argsort(codes, kind="stable")
+    bounds = np.flatnonzero(np.diff(codes[order])) + 1
+    names = rows["college_name"].to_numpy()
+    districts = rows["district"].to_numpy()
+    tasks, task, task_rows = [], [], 0
+    for block in np.split(order, bounds):
+        if len(block) < 2:
+            continue
+        task.append((block, names[block].tolist(), tuple(_words(districts[block[0]]))))
+        task_rows += len(block)
+        if task_rows >= TASK_ROWS:
+            tasks.append(task)
+            task, task_rows = [], 0
+    if task:
+        tasks.append(task)
+    progress(f"{n:,} rows in {len(bounds) + 1 if n else 0:,} blocks; matching in {len(tasks)} tasks")
+    links = []
+    if workers == 1 or len(tasks) <= 1:
+        for t in tasks:
+            links.extend(_match_task(t, threshold))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for done, found in enumerate(pool.map(_match_task, tasks, [threshold] * len(tasks)), 1):
+                links.extend(found)
+                if done % 10 == 0 or done == len(tasks):
+                    progress(f"matched {done}/{len(tasks)} tasks, {len(links):,} duplicate links")
+    cluster, link_score = _clusters(n, links)
+    rows["_cluster"] = cluster
+
+    # survivor: the most complete row of each cluster, earliest on ties
+    lists = {}
+    for col in LIST_COLUMNS:
+        parsed = {text: split_list(text) for text in pd.unique(rows[col])}
+        lists[col] = [parsed[text] for text in rows[col]]
+    completeness = sum((rows[col] != "").to_numpy(dtype=int) for col in COLLEGE_COLUMNS)
+    completeness += sum(np.fromiter(map(len, lists[col]), int, n) for col in LIST_COLUMNS)
+    completeness += rows[GEO_COLUMNS].notna().all(axis=1).to_numpy(dtype=int)
+    ranked = pd.DataFrame({"cluster": cluster, "completeness": -completeness, "row": np.arange(n)})
+    ranked = ranked.sort_values(["cluster", "completeness", "row"], kind="stable")
+    survivor_of = ranked.drop_duplicates("cluster").set_index("cluster")["row"]
+    survivors = np.sort(survivor_of.to_numpy())
+    is_survivor = np.zeros(n, dtype=bool)
+    is_survivor[survivors] = True
+
+    out = rows.loc[survivors, COLLEGE_COLUMNS + GEO_COLUMNS].reset_index(drop=True)
+    # survivor's rows first, so merged lists start with its own items and fallbacks prefer its values
+    merge_order = ranked["row"].to_numpy()
+    for col, joiner in LIST_COLUMNS.items():
+        ordered = [lists[col][row] for row in merge_order]
+        counts = np.fromiter(map(len, ordered), int, n)
+        texts = pd.Series([item for items in ordered for item in items], dtype=object)
+        keys = texts.map({text: list_key(text) for text in pd.unique(texts)}).to_numpy()
+        items = pd.DataFrame({"cluster": np.repeat(cluster[merge_order], counts), "key": keys,
+                              "text": _canonical(texts.to_numpy(), keys)}).drop_duplicates(["cluster", "key"])
+        out[col] = _join_groups(items["cluster"].to_numpy(), items["text"].tolist(), joiner).reindex(cluster[survivors]).fillna("").to_numpy()
+    by_cluster = rows.iloc[merge_order][["_cluster", "contact"] + GEO_COLUMNS].replace({"contact": {"": None}}).groupby("_cluster", sort=False)
+    for col in ["contact"] + GEO_COLUMNS:
+        out[col] = by_cluster[col].first().reindex(cluster[survivors]).to_numpy()
+    out["contact"] = out["contact"].fillna("")
+
+    merged_rows = np.flatnonzero(~is_survivor)
+    kept = survivor_of.reindex(cluster[merged_rows]).to_numpy()
+    report = pd.DataFrame({
+        "kept_name": names[kept], "kept_source": rows["source"].to_numpy()[kept], "kept_line": rows["line"].to_numpy()[kept],
+        "merged_name": names[merged_rows], "district": districts[merged_rows], "state": rows["state"].to_numpy()[merged_rows],
+        "source": rows["source"].to_numpy()[merged_rows], "line": rows["line"].to_numpy()[merged_rows],
+        "similarity": link_score[merged_rows].round(3),
+        "match": np.where(link_score[merged_rows] >= 1.0, "exact", "fuzzy"),
+    })
+    return out, report
+
+def run_import(paths, out_dir=IMPORTS_DIR, with_current=False, threshold=DEDUPE_THRESHOLD, workers=None, progress=print):
+    """Read, merge and write one import version. Returns (version directory, summary dict)."""
+    start = time.perf_counter()
+    if with_current:
+        paths = [active_source(COLLEGES_PATH)] + list(paths)
+    rows, errors, rejected, truncated = read_lists(paths, progress)
+    directory, report = merge_colleges(rows, threshold, workers, progress)
+    version = time.strftime("%Y%m%d-%H%M%S")
+    final = os.path.join(out_dir, version)
+    tmp = os.path.join(out_dir, f".{version}.{os.getpid()}")
+    os.makedirs(tmp)
+    try:
+        directory.to_parquet(os.path.join(tmp, "colleges.parquet"), index=False)
+        report.to_csv(os.path.join(tmp, "merge_report.csv"), index=False)
+        errors.to_csv(os.path.join(tmp, "rejected_rows.csv"), index=False)
+        summary = {"version": version, "inputs": list(paths), "rows_read": len(rows) + rejected,
+                   "rows_rejected": rejected, "rows_valid": len(rows), "errors_reported": len(errors),
+                   "errors_truncated": truncated, "colleges": len(directory),
+                   "duplicates_merged": len(report), "fuzzy_merges": int((report["match"] == "fuzzy").sum()),
+                   "threshold": threshold, "seconds": round(time.perf_counter() - start, 1)}
+        with open(os.path.join(tmp, "summary.json"), "w") as f:
+            json.dump(summary, f, indent=2)
+        os.rename(tmp, final)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return final, summary
+
+def install(version_dir, colleges_path=COLLEGES_PATH):
+    """Make an import version the app's directory: atomically replace the Parquet store."""
+    dest = store_path(colleges_path)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    shutil.copyfile(os.path.join(version_dir, "colleges.parquet"), tmp)
+    os.replace(tmp, dest)
+    return dest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge state college lists into one deduplicated directory.")
+    parser.add_argument("inputs", nargs="+", help="CSV or Parquet files in the colleges layout")
+    parser.add_argument("-o", "--out-dir", default=IMPORTS_DIR, help="where import versions are written")
+    parser.add_argument("--with-current", action="store_true", help="merge into the app's current directory")
+    parser.add_argument("--threshold", type=float, default=DEDUPE_THRESHOLD, help="name similarity (0-1) to merge at")
+    parser.add_argument("--workers", type=int, default=None, help="matching processes (default: CPU count)")
+    parser.add_argument("--install", action="store_true", help="replace the app's directory with the result")
+    args = parser.parse_args(argv)
+    log = lambda msg: print(msg, file=sys.stderr)
+    version_dir, summary = run_import(args.inputs, args.out_dir, args.with_current, args.threshold, args.workers, log)
+    log(f"{summary['rows_valid']:,} valid rows ({summary['rows_rejected']:,} rejected) -> {summary['colleges']:,} colleges, "
+        f"{summary['duplicates_merged']:,} duplicates merged ({summary['fuzzy_merges']:,} fuzzy) in {summary['seconds']}s")
+    if summary["errors_truncated"]:
+        log(f"rejected_rows.csv is truncated to the first {summary['errors_reported']:,} errors")
+    log(f"wrote {version_dir}")
+    if args.install:
+        log(f"installed as {install(version_dir)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
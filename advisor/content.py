@@ -0,0 +1,72 @@
+# advisor/content.py
+# Guidance content packs: stream roadmaps, study resources, FAQs and career tips.
+#
+# Content lives in one JSON file per locale under CONTENT_DIR (en.json, hi.json,
+# ...) so it can be corrected or translated without a redeploy. A locale file
+# may leave sections out; those fall back to DEFAULT_LOCALE. Roadmap keys are the
+# quiz streams in every locale, and the recommender's path list always comes from
+# the default locale, so translations change wording, not identifiers.
+#
+# Nothing here caches: callers key parsed packs by content_version(), which only
+# re-hashes a file after its mtime or size changes.
+
+import json
+import os
+
+from advisor.sources import DATA_DIR, source_version
+
+CONTENT_DIR = os.environ.get("CONTENT_DIR", os.path.join(DATA_DIR, "content"))
+DEFAULT_LOCALE = "en"
+CONTENT_SECTIONS = ["roadmaps", "study_resources", "career_tips", "faqs"]
+# shown in the language picker before a pack is loaded; other codes show as-is
+LOCALE_NAMES = {"en": "English", "hi": "हिन्दी", "bn": "বাংলা", "mr": "मराठी", "ta": "தமிழ்", "te": "తెలుగు"}
+
+def content_path(locale):
+    return os.path.join(CONTENT_DIR, f"{locale}.json")
+
+def available_locales():
+    """Locale codes with a content pack, default first."""
+    try:
+        names = os.listdir(CONTENT_DIR)
+    except FileNotFoundError:
+        return [DEFAULT_LOCALE]
+    codes = sorted(n[:-5] for n in names if n.endswith(".json"))
+    return [DEFAULT_LOCALE] + [c for c in codes if c != DEFAULT_LOCALE]
+
+def content_version(locale):
+    """Changes whenever the locale's file or the default file it falls back to changes."""
+    paths = {content_path(DEFAULT_LOCALE)}
+    if locale != DEFAULT_LOCALE and os.path.exists(content_path(locale)):
+        paths.add(content_path(locale))
+    return "+".join(source_version(p) for p in sorted(paths))
+
+def _read_pack(path):
+    with open(path, encoding="utf-8") as f:
+        pack = json.load(f)
+    if not isinstance(pack, dict):
+        raise ValueError(f"{path} must hold a JSON object")
+    return pack
+
+def read_content(locale=DEFAULT_LOCALE):
+    """One locale's content: {"locale", "name", "version", "roadmaps", "study_resources", "career_tips", "faqs"}.
+
+    `faqs` is a list of (question, answer); missing sections come from the default locale.
+    """
+    base = _read_pack(content_path(DEFAULT_LOCALE))
+    missing = [s for s in CONTENT_SECTIONS if s not in base]
+    if missing:
+        raise ValueError(f"{content_path(DEFAULT_LOCALE)} is missing sections: {', '.join(missing)}")
+    own = base if locale == DEFAULT_LOCALE else {}
+    if locale != DEFAULT_LOCALE and os.path.exists(content_path(locale)):
+        own = _read_pack(content_path(locale))
+    pack = {**base, **own}
+    if own is not base:
+        unknown = set(pack["roadmaps"]) - set(base["roadmaps"])
+        if unknown:
+            raise ValueError(f"{content_path(locale)} has roadmaps for unknown streams: {', '.join(sorted(unknown))}")
+        pack["roadmaps"] = {**base["roadmaps"], **pack["roadmaps"]}
+    pack["faqs"] = [(item["question"], item["answer"]) for item in pack["faqs"]]
+    pack["locale"] = locale
+    pack["name"] = own.get("name", LOCALE_NAMES.get(locale, locale))
+    pack["version"] = own.get("version", "")
+    return {key: pack[key] for key in ["locale", "name", "version"] + CONTENT_SECTIONS}
@@ -0,0 +1,116 @@
+# advisor/cutoffs.py
+# Rank/cut-off predictor: which colleges closed at or after a given rank.
+#
+# Closing ranks are grouped by (course, category, round, year) and each group's
+# ranks are kept sorted, so "can I get this course with rank r?" is one binary
+# search, and everything from that point to the end of the group is eligible.
+# Groups for "any round" and "any year" hold each college's most lenient rank
+# across rounds/years, so those queries are single searches too.
+
+import numpy as np
+
+ANY = -1  # round/year value meaning "best across all rounds/years"
+
+def _college_key(name, district):
+    return name.astype("string").str.strip().str.lower() + "|" + district.astype("string").str.strip().str.lower()
+
+def _max_by(key, value):
+    """Unique keys and the largest value seen for each."""
+    key, inverse = np.unique(key, return_inverse=True)
+    best = np.full(len(key), np.iinfo(value.dtype).min, dtype=value.dtype)
+    np.maximum.at(best, inverse, value)
+    return key, best
+
+class CutoffIndex:
+    """Sorted closing ranks per (course, category, round, year), held in one CSR layout."""
+
+    def __init__(self, cutoffs, colleges):
+        import pandas as pd
+        positions = pd.Series(np.arange(len(colleges)), index=_college_key(colleges["college_name"], colleges["district"]))
+        positions = positions[~positions.index.duplicated()]
+        row = _college_key(cutoffs["college_name"], cutoffs["district"]).map(positions)
+        self.unmatched = int(row.isna().sum())  # cut-offs for colleges not in the directory
+        known = row.notna().to_numpy()
+        course, courses = pd.factorize(cutoffs["course"].astype("string")[known], sort=True)
+        category, categories = pd.factorize(cutoffs["category"].astype("string")[known], sort=True)
+        rounds, round_code = np.unique(cutoffs["round"].to_numpy(dtype=np.int64)[known], return_inverse=True)
+        years, year_code = np.unique(cutoffs["year"].to_numpy(dtype=np.int64)[known], return_inverse=True)
+        self.courses, self.categories = courses.tolist(), categories.tolist()
+        self.rounds, self.years = rounds.tolist(), years[::-1].tolist()
+
+        # every (college, group) pair is one int64: group * n_rows + row, where the group
+        # packs course, category, round and year codes; code 0 is ANY for round and year
+        n_rows, n_rounds, n_years = max(len(colleges), 1), len(rounds) + 1, len(years) + 1
+        group = ((course.astype(np.int64) * len(categories) + category) * n_rounds + round_code + 1) * n_years + year_code + 1
+        exact, exact_rank = _max_by(group * n_rows + row[known].to_numpy(dtype=np.int64),
+                                    cutoffs["closing_rank"].to_numpy(dtype=np.int64)[known])
+        def without(pairs, ranks, place):  # collapse round (place=n_years) or year (place=1) to ANY
+            g, r = np.divmod(pairs, n_rows)
+            return _max_by((g - (g // place % (n_years if place == 1 else n_rounds)) * place) * n_rows + r, ranks)
+        any_round = without(exact, exact_rank, n_years)
+        any_year = without(exact, exact_rank, 1)
+        any_both = without(*any_round, 1)
+        pairs = np.concatenate([exact, any_round[0], any_year[0], any_both[0]])
+        ranks = np.concatenate([exact_rank, any_round[1], any_year[1], any_both[1]])
+
+        group, rows = np.divmod(pairs, n_rows)
+        top = int(ranks.max()) + 1 if len(ranks) else 1
+        if (int(group.max()) + 1 if len(group) else 1) * top < 2 ** 62:  # one argsort on a packed key is much faster
+            order = np.argsort(group * top + ranks, kind="stable")
+        else:
+            order = np.lexsort((ranks, group))
+        self.ranks, self.rows, group = ranks[order], rows[order], group[order]
+        codes = np.unique(group)
+        self.offsets = np.searchsorted(group, np.r_[codes, codes[-1] + 1 if len(codes) else 0])
+        # (course name, category, round, year) -> group id; round/year are ANY for the collapsed groups
+        course_cat, rest = np.divmod(codes, n_rounds * n_years)
+        r_code, y_code = np.divmod(rest, n_years)
+        self.group_course = (course_cat // len(categories)).astype(np.int32)
+        round_values = [ANY] + self.rounds
+        year_values = [ANY] + years.tolist()
+        self.group = {
+            (self.courses[c // len(categories)], self.categories[c % len(categories)], round_values[r], year_values[y]): i
+            for i, (c, r, y) in enumerate(zip(course_cat.tolist(), r_code.tolist(), y_code.tolist()))
+        }
+
+    def eligible(self, rank, category, round_no=ANY, year=ANY, courses=None, allowed=None):
+        """(college rows, course ids, closing ranks) of every course that closed at or after `rank`.
+
+        `courses` limits the search to those course names; `allowed` is an optional
+        boolean row mask (e.g. the sidebar filters). Pairs come out grouped by course.
+        """
+        rows, course_ids, closing = [], [], []
+        for course in (self.courses if courses is None else courses):
+            g = self.group.get((course, category, round_no, year))
+            if g is None:
+                continue
+            lo, hi = self.offsets[g], self.offsets[g + 1]
+            start = lo + np.searchsorted(self.ranks[lo:hi], rank, side="left")
+            rows.append(self.rows[start:hi])
+            closing.append(self.ranks[start:hi])
+            course_ids.append(np.full(hi - start, self.group_course[g], dtype=np.int32))
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64)
+        rows, course_ids, closing = np.concatenate(rows), np.concatenate(course_ids), np.concatenate(closing)
+        if allowed is not None:
+            keep = allowed[rows]
+            rows, course_ids, closing = rows[keep], course_ids[keep], closing[keep]
+        return rows, course_ids, closing
+
+    def by_college(self, rows, course_ids, closing):
+        """Collapse eligible pairs to one entry per college: (rows, tightest closing rank), tightest first."""
+        if not len(rows):
+            return rows, closing
+        order = np.lexsort((closing, rows))
+        first = np.flatnonzero(np.r_[True, rows[order][1:] != rows[order][:-1]])
+        best_rows, best = rows[order][first], closing[order][first]
+        by_rank = np.lexsort((best_rows, best))
+        return best_rows[by_rank], best[by_rank]
+
+    def describe(self, rows, course_ids, closing, for_rows):
+        """Text like "B.Com (12,345); BBA (20,110)" for each of `for_rows`, tightest course first."""
+        picked = np.isin(rows, for_rows)
+        text = {}
+        for r, c, k in sorted(zip(rows[picked].tolist(), closing[picked].tolist(), course_ids[picked].tolist())):
+            text.setdefault(r, []).append(f"{self.courses[k]} ({c:,})")
+        return ["; ".join(text.get(r, [])) for r in np.asarray(for_rows).tolist()]
@@ -0,0 +1,61 @@
+# advisor/data.py
+# Readers for the college directory, timeline and PIN gazetteer.
+#
+# Frames returned here are shared by every session once the app caches them.
+# Treat them as read-only: filter with masks, never assign into them.
+
+import numpy as np
+import pandas as pd
+
+from advisor.sources import CATEGORICAL_COLUMNS, COLLEGE_COLUMNS, CUTOFF_COLUMNS, GEO_COLUMNS, TIMELINE_COLUMNS
+
+# pandas 3 always copies on write; older versions need it switched on so that
+# filtered frames stay lazy views of the cached directory instead of copies.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+def read_table(path, columns=None):
+    if path.endswith((".parquet", ".pq")):
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, dtype="string")
+
+def read_colleges(path):
+    """College directory with string/categorical columns and float coordinates (NaN when absent)."""
+    df = read_table(path)
+    missing = [c for c in COLLEGE_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+    for col in COLLEGE_COLUMNS:
+        if col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype("category")
+        else:
+            df[col] = df[col].astype("string").fillna("")
+    for col in GEO_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64") if col in df.columns else np.nan
+    return df.reset_index(drop=True)
+
+def read_timeline(path):
+    df = read_table(path)
+    missing = [c for c in TIMELINE_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+    return df[TIMELINE_COLUMNS].reset_index(drop=True)
+
+def read_cutoffs(path):
+    """Closing ranks with integer round/year/rank columns; rows without a usable rank are dropped."""
+    df = read_table(path)
+    missing = [c for c in CUTOFF_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+    df = df[CUTOFF_COLUMNS].copy()
+    for col in ("college_name", "district", "course", "category"):
+        df[col] = df[col].astype("string").str.strip().fillna("")
+    for col in ("round", "year", "closing_rank"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df.dropna(subset=["round", "year", "closing_rank"])
+    return df.astype({"round": "int64", "year": "int64", "closing_rank": "int64"}).reset_index(drop=True)
+
+def read_pincodes(path):
+    """PIN code -> (lat, lon)."""
+    df = read_table(path, columns=["pincode", "latitude", "longitude"])
+    return {str(p).strip(): (float(a), float(b)) for p, a, b in zip(df["pincode"], df["latitude"], df["longitude"])}
@@ -0,0 +1,36 @@
+# advisor/export.py
+# Chunked encoders for directory downloads: CSV, gzip'd CSV, Parquet and Feather.
+# pyarrow is only imported for the columnar formats.
+
+import gzip
+
+EXPORT_CHUNK_ROWS = 50_000
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Feather": ("feather", "application/vnd.apache.arrow.file"),
+}
+
+def write_export(df, fmt, fileobj, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Encode `df` into `fileobj` in `fmt`, at most `chunk_rows` rows at a time."""
+    if fmt in ("CSV", "CSV (gzip)"):
+        out = gzip.GzipFile(fileobj=fileobj, mode="wb", mtime=0) if fmt == "CSV (gzip)" else fileobj
+        for start in range(0, max(len(df), 1), chunk_rows):
+            out.write(df.iloc[start:start + chunk_rows].to_csv(index=False, header=start == 0).encode("utf-8"))
+        if out is not fileobj:
+            out.close()
+        return fileobj
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    if fmt == "Parquet":
+        writer = pq.ParquetWriter(fileobj, schema)
+    elif fmt == "Feather":
+        writer = pa.ipc.new_file(fileobj, schema)  # Feather v2 is the Arrow IPC file format
+    else:
+        raise ValueError(f"unknown export format: {fmt}")
+    with writer:
+        for start in range(0, len(df), chunk_rows):
+            writer.write_table(pa.Table.from_pandas(df.iloc[start:start + chunk_rows], schema=schema, preserve_index=False))
+    return fileobj
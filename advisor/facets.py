@@ -0,0 +1,82 @@
+# advisor/facets.py
+# Packed-bitmap facet index behind the sidebar filters and their counts.
+
+import numpy as np
+import pandas as pd
+
+# Multi-valued columns and their separators; state is single-valued.
+FACET_SEPARATORS = {"streams": ",", "courses": ";", "facilities": ",", "state": None}
+
+def _popcount_rows(bits):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(bits, axis=1).sum(axis=1, dtype=np.int64)
+
+class FacetIndex:
+    """One packed bitmap per distinct facet value, so filters are byte-wise ANDs.
+
+    Values are matched exactly after splitting, so "Arts" no longer matches
+    every stream that merely contains the letters "arts".
+    """
+
+    def __init__(self, df, separators=FACET_SEPARATORS):
+        self.n_rows = len(df)
+        self.n_bytes = (self.n_rows + 7) // 8
+        self.all_bits = np.packbits(np.ones(self.n_rows, dtype=bool))
+        self.values, self.position, self.bits, self.totals = {}, {}, {}, {}
+        for col, sep in separators.items():
+            s = df[col].astype("string").fillna("")
+            if sep:
+                s = s.str.split(sep).explode()
+            s = s.str.strip()
+            s = s[s != ""]
+            codes, uniques = pd.factorize(s)
+            rows = s.index.to_numpy(dtype=np.int64)  # directory has a RangeIndex
+            bits = np.zeros((len(uniques), self.n_bytes), dtype=np.uint8)
+            np.bitwise_or.at(bits, (codes, rows >> 3), (0x80 >> (rows & 7)).astype(np.uint8))
+            totals = _popcount_rows(bits)
+            order = sorted(range(len(uniques)), key=lambda i: (-totals[i], uniques[i]))
+            self.values[col] = [str(uniques[i]) for i in order]
+            self.position[col] = {v: i for i, v in enumerate(self.values[col])}
+            self.bits[col] = bits[order]
+            self.totals[col] = totals[order]
+
+    def to_arrays(self):
+        arrays = {"all_bits": self.all_bits}
+        for col in self.values:
+            arrays[f"bits_{col}"], arrays[f"totals_{col}"] = self.bits[col], self.totals[col]
+        return arrays, {"n_rows": self.n_rows, "values": self.values}
+
+    @classmethod
+    def from_arrays(cls, arrays, meta):
+        """Bitmaps and totals stay mapped; only the small value -> position maps are rebuilt."""
+        self = cls.__new__(cls)
+        self.n_rows = meta["n_rows"]
+        self.n_bytes = (self.n_rows + 7) // 8
+        self.all_bits = arrays["all_bits"]
+        self.values = meta["values"]
+        self.position = {col: {v: i for i, v in enumerate(values)} for col, values in self.values.items()}
+        self.bits = {col: arrays[f"bits_{col}"] for col in self.values}
+        self.totals = {col: arrays[f"totals_{col}"] for col in self.values}
+        return self
+
+    def _selection_bits(self, selections, skip=None):
+        out = self.all_bits.copy()
+        for col, chosen in selections.items():
+            if col == skip or not chosen or chosen == "All":
+                continue
+            for value in ([chosen] if isinstance(chosen, str) else chosen):
+                i = self.position[col].get(value)
+                if i is None:
+                    return np.zeros_like(out)
+                out &= self.bits[col][i]
+        return out
+
+    def mask(self, selections):
+        """Boolean row mask for {column: value or [values]}; lists mean all of them."""
+        return np.unpackbits(self._selection_bits(selections), count=self.n_rows).astype(bool)
+
+    def counts(self, col, selections, exclude_self=True):
+        """Rows per value of `col` under the other active selections."""
+        base = self._selection_bits(selections, skip=col if exclude_self else None)
+        return dict(zip(self.values[col], _popcount_rows(self.bits[col] & base).tolist()))
@@ -0,0 +1,103 @@
+# advisor/geo.py
+# Grid index for "colleges near me": radius and k-nearest queries by haversine distance.
+
+import re
+
+import numpy as np
+
+from advisor.sources import GEO_COLUMNS
+from advisor.search import tokenize
+
+EARTH_RADIUS_KM = 6371.0
+_LATLON_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; arguments in radians, arrays broadcast."""
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+class GeoIndex:
+    """Uniform lat/lon grid over colleges with coordinates.
+
+    Points are sorted by cell id, so each grid row of a query box is one
+    searchsorted slice; exact haversine distances are only computed for
+    the candidates in those slices.
+    """
+
+    def __init__(self, df, cell_deg=0.5):
+        lat = df["latitude"].to_numpy(dtype=np.float64)
+        lon = df["longitude"].to_numpy(dtype=np.float64)
+        has = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+        self.cell_deg = cell_deg
+        self.n_lon_cells = int(np.ceil(360 / cell_deg)) + 1
+        keys = self._cell(lat[has], lon[has])
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.rows = has[order]
+        self.lat = np.radians(lat[self.rows])
+        self.lon = np.radians(lon[self.rows])
+        # district centroids double as the gazetteer for "near my district"
+        located = df.iloc[has]
+        centroids = located.groupby("district", observed=True)[GEO_COLUMNS].mean()
+        self.districts = {" ".join(tokenize(d)): (float(r.latitude), float(r.longitude))
+                          for d, r in centroids.iterrows()}
+
+    def to_arrays(self):
+        arrays = {"keys": self.keys, "rows": self.rows, "lat": self.lat, "lon": self.lon}
+        return arrays, {"cell_deg": self.cell_deg, "districts": self.districts}
+
+    @classmethod
+    def from_arrays(cls, arrays, meta):
+        self = cls.__new__(cls)
+        self.cell_deg = meta["cell_deg"]
+        self.n_lon_cells = int(np.ceil(360 / self.cell_deg)) + 1
+        self.keys, self.rows, self.lat, self.lon = arrays["keys"], arrays["rows"], arrays["lat"], arrays["lon"]
+        self.districts = {d: tuple(point) for d, point in meta["districts"].items()}
+        return self
+
+    def _cell(self, lat, lon):
+        i = np.floor((np.asarray(lat) + 90) / self.cell_deg).astype(np.int64)
+        j = np.floor((np.asarray(lon) + 180) / self.cell_deg).astype(np.int64)
+        return i * self.n_lon_cells + j
+
+    def _candidates(self, lat, lon, radius_km):
+        dlat = np.degrees(radius_km / EARTH_RADIUS_KM)
+        dlon = dlat / max(np.cos(np.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        i0, i1 = (np.floor((np.clip([lat - dlat, lat + dlat], -90, 90) + 90) / self.cell_deg)).astype(np.int64)
+        j0, j1 = (np.floor((np.clip([lon - dlon, lon + dlon], -180, 180) + 180) / self.cell_deg)).astype(np.int64)
+        rows = np.arange(i0, i1 + 1) * self.n_lon_cells
+        lo = np.searchsorted(self.keys, rows + j0, side="left")
+        hi = np.searchsorted(self.keys, rows + j1, side="right")
+        if not len(lo):
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)])
+
+    def within(self, lat, lon, radius_km, allowed=None):
+        """(row positions, distances in km) within `radius_km`, nearest first."""
+        idx = self._candidates(lat, lon, radius_km)
+        if allowed is not None:
+            idx = idx[allowed[self.rows[idx]]]
+        dist = haversine_km(np.radians(lat), np.radians(lon), self.lat[idx], self.lon[idx])
+        keep = dist <= radius_km
+        idx, dist = idx[keep], dist[keep]
+        order = np.lexsort((self.rows[idx], dist))
+        return self.rows[idx][order], dist[order]
+
+    def nearest(self, lat, lon, k, allowed=None):
+        """The `k` closest colleges (optionally among `allowed` rows), nearest first."""
+        radius = 50.0
+        while True:
+            rows, dist = self.within(lat, lon, radius, allowed)
+            if len(rows) >= k or radius >= np.pi * EARTH_RADIUS_KM:
+                return rows[:k], dist[:k]
+            radius *= 4
+
+    def locate(self, text, pincodes=None):
+        """(lat, lon) for a "lat, lon" pair, a PIN code or a district name; None if unknown."""
+        text = text.strip()
+        m = _LATLON_RE.match(text)
+        if m:
+            return float(m.group(1)), float(m.group(2))
+        if pincodes is not None and text.isdigit():
+            return pincodes.get(text)
+        return self.districts.get(" ".join(tokenize(text)))
@@ -0,0 +1,149 @@
+# advisor/ingest.py
+# Uploads are read in chunks, validated against a declared schema and streamed
+# into the Parquet store that the app's directory/timeline loaders read from.
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from advisor.sources import COLLEGE_COLUMNS, CUTOFF_COLUMNS
+
+INGEST_MEMORY_LIMIT_MB = int(os.environ.get("INGEST_MEMORY_LIMIT_MB", "128"))
+INGEST_MAX_ERRORS = 1000  # row-level errors kept for the report
+
+COLLEGE_SCHEMA = {
+    "columns": {**{col: "string" for col in COLLEGE_COLUMNS}, "latitude": "float", "longitude": "float"},
+    "required": ["college_name", "district", "state"],
+    "dates": {},
+    "defaults": {},
+    "checks": [
+        ("latitude", "latitude out of range", lambda d: d["latitude"].abs() > 90),
+        ("longitude", "longitude out of range", lambda d: d["longitude"].abs() > 180),
+    ],
+}
+TIMELINE_SCHEMA = {
+    "columns": {"event": "string", "start_date": "date", "end_date": "date", "type": "string"},
+    "required": ["event", "start_date", "type"],
+    "dates": {"start_date": "%Y-%m-%d", "end_date": "%Y-%m-%d"},
+    "defaults": {"end_date": "start_date"},  # one-day events may leave end_date blank
+    "checks": [("end_date", "ends before it starts", lambda d: d["end_date"] < d["start_date"])],
+}
+CUTOFF_SCHEMA = {
+    "columns": {col: ("int" if col in ("round", "year", "closing_rank") else "string") for col in CUTOFF_COLUMNS},
+    "required": CUTOFF_COLUMNS,
+    "dates": {},
+    "defaults": {},
+    "checks": [
+        ("closing_rank", "rank must be positive", lambda d: d["closing_rank"] < 1),
+        ("round", "round must be positive", lambda d: d["round"] < 1),
+    ],
+}
+
+def _arrow_schema(schema):
+    types = {"string": pa.string(), "date": pa.timestamp("ns"), "float": pa.float64(), "int": pa.int64()}
+    return pa.schema([(col, types[kind]) for col, kind in schema["columns"].items()])
+
+def validate_chunk(chunk, schema):
+    """Coerce one chunk to the schema. Returns (valid rows, list of row-level error dicts).
+
+    The chunk index is the 0-based data row, so CSV line numbers are index + 2.
+    """
+    chunk = chunk.reindex(columns=list(schema["columns"]))
+    bad = pd.Series(False, index=chunk.index)
+    errors = []
+
+    def flag(mask, col, message):
+        nonlocal bad
+        mask = mask.fillna(False).astype(bool)
+        for i in mask.index[mask & ~bad][:INGEST_MAX_ERRORS]:
+            errors.append({"line": int(i) + 2, "column": col, "value": str(raw.get(col, {}).get(i, "")), "error": message})
+        bad |= mask
+
+    raw = {col: chunk[col] for col in chunk.columns}
+    for col, kind in schema["columns"].items():
+        if kind == "string":
+            chunk[col] = chunk[col].astype("string").str.strip()
+    for col in schema["required"]:
+        values = chunk[col].astype("string").str.strip()
+        flag(values.isna() | (values == ""), col, "required value is missing")
+    for col, kind in schema["columns"].items():
+        if kind == "float" and not pd.api.types.is_float_dtype(chunk[col]):
+            text = chunk[col].astype("string").str.strip().replace("", pd.NA)
+            parsed = pd.to_numeric(text, errors="coerce").astype("float64")
+            flag(parsed.isna() & text.notna(), col, "not a number")
+            chunk[col] = parsed
+        elif kind == "int" and not pd.api.types.is_integer_dtype(chunk[col]):
+            text = chunk[col].astype("string").str.strip().replace("", pd.NA)
+            parsed = pd.to_numeric(text, errors="coerce").astype("float64")
+            flag((parsed.isna() | (parsed % 1 != 0)) & text.notna(), col, "not a whole number")
+            chunk[col] = parsed.round().astype("Int64")
+    for col, fmt in schema["dates"].items():
+        if pd.api.types.is_datetime64_any_dtype(chunk[col]):
+            continue
+        text = chunk[col].astype("string").str.strip().replace("", pd.NA)
+        parsed = pd.to_datetime(text, format=fmt, errors="coerce")
+        flag(parsed.isna() & text.notna(), col, f"not a date in {fmt} format")
+        chunk[col] = parsed
+    for col, source in schema["defaults"].items():
+        chunk[col] = chunk[col].fillna(chunk[source])
+    for col, message, check in schema["checks"]:
+        flag(check(chunk), col, message)
+    for col, kind in schema["columns"].items():
+        if kind == "string":
+            chunk[col] = chunk[col].fillna("")
+    return chunk[~bad], errors
+
+def ingest_csv(source, schema, dest, base=None, progress=None, memory_limit_mb=INGEST_MEMORY_LIMIT_MB):
+    """Stream a CSV into the Parquet store at `dest`, optionally after the rows of `base`.
+
+    Chunk size adapts so one parsed chunk stays well under `memory_limit_mb`.
+    Nothing is published unless every chunk was read; the store is swapped in
+    atomically, so readers see either the old or the new version.
+    Returns a report dict with row counts and a DataFrame of rejected rows; rows of
+    `base` that no longer pass the schema are rejected too, with source "current data".
+    """
+    total_bytes = getattr(source, "size", None) or 0
+    budget = memory_limit_mb * 1024 * 1024 // 4  # leave room for coercion copies
+    chunk_rows = 10_000
+    written = rejected = 0
+    errors = []
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    reader = pd.read_csv(source, dtype="string", chunksize=chunk_rows, keep_default_na=False)
+    try:
+        with reader, pq.ParquetWriter(tmp, _arrow_schema(schema)) as writer:
+            if base is not None and len(base):
+                for start in range(0, len(base), chunk_rows):
+                    part = base.iloc[start:start + chunk_rows].reset_index(drop=True)
+                    part.index += start  # line numbers count through the current data
+                    part = part.astype({c: "string" for c, kind in schema["columns"].items() if kind == "string" and c in part.columns})
+                    good, part_errors = validate_chunk(part, schema)
+                    writer.write_table(pa.Table.from_pandas(good, schema=writer.schema, preserve_index=False))
+                    written += len(good)
+                    rejected += len(part) - len(good)
+                    errors.extend({"source": "current data", **e} for e in part_errors[:INGEST_MAX_ERRORS - len(errors)])
+            while True:
+                try:
+                    chunk = reader.get_chunk(chunk_rows)
+                except StopIteration:
+                    break
+                missing = [c for c in schema["required"] if c not in chunk.columns]
+                if missing:
+                    raise ValueError(f"missing required columns: {', '.join(missing)}")
+                good, chunk_errors = validate_chunk(chunk, schema)
+                writer.write_table(pa.Table.from_pandas(good, schema=writer.schema, preserve_index=False))
+                written += len(good)
+                rejected += len(chunk) - len(good)
+                errors.extend({"source": "upload", **e} for e in chunk_errors[:INGEST_MAX_ERRORS - len(errors)])
+                per_row = max(1, chunk.memory_usage(deep=True).sum() // max(1, len(chunk)))
+                chunk_rows = int(min(200_000, max(1_000, budget // per_row)))
+                if progress and total_bytes:
+                    done = min(1.0, source.tell() / total_bytes)
+                    progress(done, f"Imported {written:,} rows, rejected {rejected:,}")
+        os.replace(tmp, dest)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return {"written": written, "rejected": rejected, "path": dest,
+            "errors": pd.DataFrame(errors, columns=["source", "line", "column", "value", "error"]).sort_values(["source", "line"], kind="stable")}
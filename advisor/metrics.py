@@ -0,0 +1,112 @@
+# advisor/metrics.py
+# Process-wide latency histograms and counters. Set METRICS_PATH to write them out:
+# a *.prom path gets Prometheus text (for node_exporter's textfile collector),
+# anything else gets one JSON line per flush. "{pid}" in the path is replaced
+# so several workers on a node don't overwrite each other.
+
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_PATH = os.environ.get("METRICS_PATH")
+METRICS_FLUSH_SECONDS = float(os.environ.get("METRICS_FLUSH_SECONDS", "15"))
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+BYTES_BUCKETS = (1e3, 1e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6, 1e7)
+
+class Metrics:
+    """Histograms and counters keyed by (name, labels), safe to share across sessions."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}  # (name, labels) -> {"buckets", "counts", "sum", "count"}
+        self.counters = {}    # (name, labels) -> value
+        self.last_flush = time.time()
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            h = self.histograms.get(key)
+            if h is None:
+                h = self.histograms[key] = {"buckets": buckets, "counts": [0] * (len(buckets) + 1), "sum": 0.0, "count": 0}
+            h["counts"][bisect.bisect_left(h["buckets"], value)] += 1
+            h["sum"] += value
+            h["count"] += 1
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timed(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @staticmethod
+    def quantile(h, q):
+        """Upper bucket bound holding the q-th observation (Prometheus-style estimate)."""
+        rank, seen = q * h["count"], 0
+        for bound, n in zip(list(h["buckets"]) + [float("inf")], h["counts"]):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "ts": time.time(),
+                "pid": os.getpid(),
+                "histograms": [{"name": n, "labels": dict(l), "buckets": list(h["buckets"]), "counts": list(h["counts"]),
+                                "sum": h["sum"], "count": h["count"]} for (n, l), h in self.histograms.items()],
+                "counters": [{"name": n, "labels": dict(l), "value": v} for (n, l), v in self.counters.items()],
+            }
+
+    def prometheus_text(self):
+        def fmt(labels, extra=()):
+            items = list(labels) + list(extra)
+            return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}" if items else ""
+        lines, typed = [], set()
+        snap = self.snapshot()
+        # a metric's samples must be contiguous in the exposition format
+        for c in sorted(snap["counters"], key=lambda c: c["name"]):
+            name = f"advisor_{c['name']}"
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{fmt(c['labels'].items())} {c['value']}")
+        for h in sorted(snap["histograms"], key=lambda h: h["name"]):
+            name = f"advisor_{h['name']}"
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            labels, seen = h["labels"].items(), 0
+            for bound, n in zip(h["buckets"] + ["+Inf"], h["counts"]):
+                seen += n
+                lines.append(f"{name}_bucket{fmt(labels, [('le', bound)])} {seen}")
+            lines.append(f"{name}_sum{fmt(labels)} {h['sum']}")
+            lines.append(f"{name}_count{fmt(labels)} {h['count']}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self, path):
+        path = path.replace("{pid}", str(os.getpid()))
+        if path.endswith(".prom"):
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                f.write(self.prometheus_text())
+            os.replace(tmp, path)  # scrapers never see a half-written file
+        else:
+            with open(path, "a") as f:
+                f.write(json.dumps(self.snapshot()) + "\n")
+        self.last_flush = time.time()
+
+    def maybe_flush(self, path=METRICS_PATH):
+        if path and time.time() - self.last_flush >= METRICS_FLUSH_SECONDS:
+            self.flush(path)
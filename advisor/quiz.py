@@ -0,0 +1,164 @@
+# advisor/quiz.py
+# Vectorized scoring for the aptitude quiz, shared by the Streamlit page and batch runs.
+# Run: python -m advisor.quiz responses.csv -o results.csv   (or python quiz_engine.py ...)
+#
+# responses.csv columns: name, class, q1..q5. Answers may be the option text
+# shown in the app or the option number (1-4).
+#
+# Scoring one student needs only numpy; pandas is imported by the batch helpers
+# that build or read frames, so the quiz page doesn't pay for it.
+
+import argparse
+import sys
+from datetime import datetime
+
+import numpy as np
+
+STREAMS = ["Science", "Commerce", "Arts/Humanities", "Vocational/Skill-based"]
+CLASS_OPTIONS = ["Class 10", "Class 11", "Class 12", "Other"]
+
+# (response column, question, options)
+QUIZ_QUESTIONS = [
+    ("q1", "1) Which subject do you enjoy the most?",
+     ["Math & Science", "Business & Numbers", "Arts & Languages", "Practical/Hands-on"]),
+    ("q2", "2) What type of career excites you?",
+     ["Engineer/Doctor/Researcher", "Business/Accountant/Manager", "Writer/Designer/Teacher", "Technical/Vocational Jobs"]),
+    ("q3", "3) Which school activity would you choose?",
+     ["Science fair / coding / lab", "Commerce club / mock trading", "Debate / arts / theatre", "Workshops / practical sessions"]),
+    ("q4", "4) How comfortable are you with mathematics?",
+     ["Love it / strong", "Okay (for business)", "Not my favorite", "Prefer practical skills"]),
+    ("q5", "5) Long term goal you prefer?",
+     ["Tech / Research / Medicine", "Business / Finance", "Creative / Teaching / Social work", "Hands-on skilled work"]),
+]
+
+# scoring rules map
+QUIZ_MAPPING = {
+    "Math & Science": "Science", "Engineer/Doctor/Researcher": "Science", "Science fair / coding / lab": "Science",
+    "Love it / strong": "Science", "Tech / Research / Medicine": "Science",
+    "Business & Numbers": "Commerce", "Business/Accountant/Manager": "Commerce", "Commerce club / mock trading": "Commerce",
+    "Okay (for business)": "Commerce", "Business / Finance": "Commerce",
+    "Arts & Languages": "Arts/Humanities", "Writer/Designer/Teacher": "Arts/Humanities", "Debate / arts / theatre": "Arts/Humanities",
+    "Not my favorite": "Arts/Humanities", "Creative / Teaching / Social work": "Arts/Humanities",
+    "Practical/Hands-on": "Vocational/Skill-based", "Technical/Vocational Jobs": "Vocational/Skill-based", "Workshops / practical sessions": "Vocational/Skill-based",
+    "Prefer practical skills": "Vocational/Skill-based", "Hands-on skilled work": "Vocational/Skill-based"
+}
+
+RESULT_COLUMNS = ["timestamp", "name", "class", "suggested_stream"] + [f"score_{s}" for s in STREAMS]
+
+def build_weights(questions=QUIZ_QUESTIONS, mapping=QUIZ_MAPPING, streams=STREAMS):
+    """Weight matrix (total options x streams) and the first row of each question."""
+    sizes = [len(options) for _, _, options in questions]
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+    weights = np.zeros((sum(sizes), len(streams)), dtype=np.int32)
+    for q, (_, _, options) in enumerate(questions):
+        for i, option in enumerate(options):
+            stream = mapping.get(option)
+            if stream:
+                weights[offsets[q] + i, streams.index(stream)] += 1
+    return weights, offsets
+
+WEIGHTS, OPTION_OFFSETS = build_weights()
+
+def _option_lookup(options):
+    lookup = {option: i for i, option in enumerate(options)}
+    lookup.update({str(i + 1): i for i in range(len(options))})
+    return lookup
+
+def encode_answers(responses, questions=QUIZ_QUESTIONS):
+    """Option index per response and question, shape (n, questions); -1 where unanswered/unknown."""
+    codes = np.full((len(responses), len(questions)), -1, dtype=np.int64)
+    for q, (col, _, options) in enumerate(questions):
+        if col not in responses.columns:
+            continue
+        lookup = _option_lookup(options)
+        values = responses[col].astype("string").str.strip()
+        codes[:, q] = values.map(lookup).astype("float64").fillna(-1).to_numpy(dtype=np.int64)
+    return codes
+
+def one_hot(codes, offsets=OPTION_OFFSETS, n_options=WEIGHTS.shape[0]):
+    hot = np.zeros((len(codes), n_options), dtype=np.int32)
+    rows, q = np.nonzero(codes >= 0)
+    hot[rows, offsets[q] + codes[rows, q]] = 1
+    return hot
+
+def score_codes(codes, weights=WEIGHTS):
+    """Stream scores, best stream index and tie flag for each response.
+
+    Ties go to the stream listed first in STREAMS, which is what the quiz
+    page has always suggested; `tied` marks the rows where that happened.
+    """
+    scores = one_hot(codes) @ weights
+    top = scores.max(axis=1, keepdims=True)
+    best = scores.argmax(axis=1)
+    tied = (scores == top).sum(axis=1) > 1
+    return scores, best, tied
+
+def score_answers(answers):
+    """Score one student's answer list (option text, in question order)."""
+    codes = np.array([[_option_lookup(options).get(str(a).strip(), -1)
+                       for a, (_, _, options) in zip(answers, QUIZ_QUESTIONS)]], dtype=np.int64)
+    scores, best, tied = score_codes(codes)
+    return dict(zip(STREAMS, scores[0].tolist())), STREAMS[best[0]], bool(tied[0])
+
+def result_frame(names, classes, scores, best, timestamp=None):
+    """Rows in the same layout as the page's career_quiz_result.csv download."""
+    import pandas as pd
+    timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    names = pd.Series(names, dtype="string").str.strip().replace("", pd.NA).fillna("Anonymous")
+    out = pd.DataFrame({
+        "timestamp": timestamp,
+        "name": names.to_numpy(),
+        "class": np.asarray(classes),
+        "suggested_stream": np.asarray(STREAMS, dtype=object)[best],
+    })
+    for i, stream in enumerate(STREAMS):
+        out[f"score_{stream}"] = scores[:, i]
+    return out[RESULT_COLUMNS]
+
+def score_responses(responses, timestamp=None, with_ties=False):
+    """Score a DataFrame of responses (name, class, q1..q5) in one vectorized pass.
+
+    Returns (results, unknown answers, tied rows). Tied rows suggest the first of the
+    top streams; `with_ties` adds a `tied` column flagging them.
+    """
+    codes = encode_answers(responses)
+    scores, best, tied = score_codes(codes)
+    names = responses["name"] if "name" in responses.columns else [""] * len(responses)
+    classes = responses["class"].fillna("") if "class" in responses.columns else [""] * len(responses)
+    out = result_frame(names, classes, scores, best, timestamp)
+    if with_ties:
+        out["tied"] = tied
+    return out, int((codes < 0).sum()), int(tied.sum())
+
+def score_csv(src, dst, chunksize=100_000, timestamp=None, with_ties=False):
+    """Stream-score a responses CSV into a results CSV. Returns (rows, unknown answers, tied rows)."""
+    import pandas as pd
+    timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    rows = unknown = tied = 0
+    with pd.read_csv(src, dtype="string", chunksize=chunksize, keep_default_na=False) as reader:
+        for chunk in reader:
+            result, bad, ties = score_responses(chunk, timestamp, with_ties)
+            result.to_csv(dst, mode="w" if rows == 0 else "a", header=rows == 0, index=False)
+            rows += len(result)
+            unknown += bad
+            tied += ties
+    if rows == 0:
+        pd.DataFrame(columns=RESULT_COLUMNS + ["tied"] * with_ties).to_csv(dst, index=False)
+    return rows, unknown, tied
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV of quiz responses (name, class, q1..q5).")
+    parser.add_argument("responses", help="input CSV, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="results CSV (default: stdout)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows scored per chunk")
+    parser.add_argument("--with-ties", action="store_true", help="add a `tied` column for responses with several top streams")
+    args = parser.parse_args(argv)
+    src = sys.stdin if args.responses == "-" else args.responses
+    dst = sys.stdout if args.output == "-" else args.output
+    rows, unknown, tied = score_csv(src, dst, chunksize=args.chunksize, with_ties=args.with_ties)
+    print(f"scored {rows} responses ({unknown} unanswered or unrecognised answers, "
+          f"{tied} tied between streams)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
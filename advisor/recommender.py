@@ -0,0 +1,148 @@
+# advisor/recommender.py
+# Nearest-neighbour stream recommender over historical students with known outcomes.
+#
+# History rows (OUTCOMES_PATH): class, q1..q5, optional marks (0-100), the stream
+# the student went on to study and optionally the roadmap path (degree) they took.
+# Students with identical features are collapsed into one profile with per-stream
+# and per-path counts. The index is bounded by the number of distinct answer
+# patterns (5^5 x classes x mark bands), not by the number of students, so a
+# query stays one small matrix-vector product however long the history gets.
+
+import os
+
+import numpy as np
+
+from advisor.quiz import CLASS_OPTIONS, QUIZ_QUESTIONS, STREAMS, one_hot, score_codes
+from advisor.sources import DATA_DIR
+
+OUTCOMES_PATH = os.environ.get("OUTCOMES_PATH", os.path.join(DATA_DIR, "outcomes.csv"))
+MARK_BANDS = 10          # marks are compared in 10-point bands
+FEATURE_WEIGHTS = {"answers": 1.0, "class": 0.7, "marks": 0.5}
+DEFAULT_K = 50           # neighbours (students, not profiles) per query
+PRIOR_WEIGHT = 2.0       # rule-based scores count as this many extra neighbours
+
+def roadmap_paths(roadmaps):
+    """Every roadmap path, in roadmap order: [(stream, degree)]."""
+    return [(stream, p["degree"]) for stream, data in roadmaps.items() for p in data["paths"]]
+
+def _class_codes(classes):
+    lookup = {c: i for i, c in enumerate(CLASS_OPTIONS)}
+    return np.asarray([lookup.get(str(c).strip(), -1) for c in classes], dtype=np.int64)
+
+def _mark_bands(marks):
+    """Marks -> band 0..MARK_BANDS; -1 where unknown."""
+    marks = np.asarray(marks, dtype=np.float64)
+    bands = np.floor(np.clip(marks, 0, 100) / (100 / MARK_BANDS))
+    return np.where(np.isfinite(marks), bands, -1).astype(np.int64)
+
+def encode_features(codes, class_codes, bands, weights=FEATURE_WEIGHTS):
+    """Weighted feature blocks: one-hot answers and class, thermometer-coded mark band.
+
+    Squared distance between two students is then a weighted count of differing
+    answers, a class mismatch and the number of mark bands between them.
+    """
+    answers = one_hot(codes).astype(np.float32) * np.float32(np.sqrt(weights["answers"] / 2))
+    cls = np.zeros((len(codes), len(CLASS_OPTIONS)), dtype=np.float32)
+    known = np.flatnonzero(class_codes >= 0)
+    cls[known, class_codes[known]] = np.sqrt(weights["class"] / 2)
+    marks = (np.arange(MARK_BANDS)[None, :] < bands[:, None]).astype(np.float32) * np.float32(np.sqrt(weights["marks"]))
+    return np.hstack([answers, cls]), marks
+
+class StreamRecommender:
+    """Top-k nearest historical students, voting on stream and path.
+
+    Confidence is a similarity-weighted vote share, smoothed towards the quiz's
+    rule-based scores so that a thin neighbourhood doesn't swing the result.
+    `roadmaps` are the default locale's, since history records degrees by those names.
+    """
+
+    def __init__(self, history, roadmaps, k=DEFAULT_K):
+        import pandas as pd
+        from advisor.quiz import encode_answers
+        self.k = k
+        self.paths = roadmap_paths(roadmaps)
+        codes = encode_answers(history)
+        def lookup(col, values):
+            if col not in history.columns:
+                return np.full(len(history), -1, dtype=np.int64)
+            codes = history[col].astype("string").str.strip().map({v: i for i, v in enumerate(values)})
+            return codes.astype("float64").fillna(-1).to_numpy(dtype=np.int64)
+        class_codes = lookup("class", CLASS_OPTIONS)
+        marks = pd.to_numeric(history["marks"], errors="coerce") if "marks" in history.columns else np.full(len(history), np.nan)
+        bands = _mark_bands(marks)
+        if (bands >= 0).any():  # students without marks are compared as if at the median band
+            bands = np.where(bands >= 0, bands, int(np.median(bands[bands >= 0])))
+        stream_idx = lookup("stream", STREAMS)
+        keep = stream_idx >= 0
+        codes, class_codes, bands, stream_idx = codes[keep], class_codes[keep], bands[keep], stream_idx[keep]
+        path_idx = lookup("path", [degree for _, degree in self.paths])[keep]
+
+        # collapse identical students into profiles
+        radix = max(len(o) for _, _, o in QUIZ_QUESTIONS) + 1
+        key = np.zeros(len(codes), dtype=np.int64)
+        for q in range(codes.shape[1]):
+            key = key * radix + codes[:, q] + 1
+        key = (key * (len(CLASS_OPTIONS) + 1) + class_codes + 1) * (MARK_BANDS + 2) + bands + 1
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        self.n_students = len(codes)
+        self.n_profiles = len(first)
+        self.stream_counts = np.zeros((self.n_profiles, len(STREAMS)), dtype=np.float32)
+        np.add.at(self.stream_counts, (inverse, stream_idx), 1)
+        self.path_counts = np.zeros((self.n_profiles, len(self.paths)), dtype=np.float32)
+        has_path = np.flatnonzero(path_idx >= 0)
+        np.add.at(self.path_counts, (inverse[has_path], path_idx[has_path]), 1)
+        self.sizes = self.stream_counts.sum(axis=1)
+        self.base, self.marks = encode_features(codes[first], class_codes[first], bands[first])
+        self.base_sq = (self.base ** 2).sum(axis=1)
+        self.marks_sq = (self.marks ** 2).sum(axis=1)
+
+    def neighbours(self, codes, class_code, band, k=None):
+        """(profile positions, students used per profile, squared distances) of the k nearest students."""
+        k = k or self.k
+        base, marks = encode_features(codes[None, :], np.array([class_code]), np.array([max(band, 0)]))
+        dist = self.base_sq - 2 * (self.base @ base[0]) + (base[0] ** 2).sum()
+        if band >= 0:  # without marks, compare on answers and class only
+            dist += self.marks_sq - 2 * (self.marks @ marks[0]) + (marks[0] ** 2).sum()
+        m = min(k, self.n_profiles)  # every profile holds at least one student
+        top = np.argpartition(dist, m - 1)[:m] if m < self.n_profiles else np.arange(self.n_profiles)
+        top = top[np.lexsort((top, dist[top]))]
+        used = np.minimum(self.sizes[top], np.maximum(k - (np.cumsum(self.sizes[top]) - self.sizes[top]), 0))
+        keep = used > 0
+        return top[keep], used[keep], np.maximum(dist[top[keep]], 0)
+
+    def recommend(self, answers, student_class=None, marks=None, k=None):
+        """Ranked streams and roadmap paths for one student.
+
+        Returns {"streams": [(stream, confidence)], "paths": [(stream, degree, confidence)],
+        "neighbours": students consulted}; confidences in each list sum to 1.
+        """
+        codes = np.array([{o: i for i, o in enumerate(options)}.get(a, -1)
+                          for a, (_, _, options) in zip(answers, QUIZ_QUESTIONS)], dtype=np.int64)
+        class_code = _class_codes([student_class or ""])[0]
+        band = int(_mark_bands([np.nan if marks is None else marks])[0])
+        prior = score_codes(codes[None, :])[0][0].astype(np.float64)
+        prior = prior / prior.sum() if prior.sum() else np.full(len(STREAMS), 1 / len(STREAMS))
+        top, used, dist = self.neighbours(codes, class_code, band, k)
+        w = used / (1.0 + dist)  # closer students count more
+        stream_votes = (w / self.sizes[top]) @ self.stream_counts[top]
+        streams = (stream_votes + PRIOR_WEIGHT * prior) / (w.sum() + PRIOR_WEIGHT)
+
+        # paths: neighbours' paths where recorded, otherwise the stream's roadmap paths evenly
+        path_votes = (w / self.sizes[top]) @ self.path_counts[top]
+        by_stream = np.asarray([STREAMS.index(s) for s, _ in self.paths])
+        per_stream = np.bincount(by_stream, weights=path_votes, minlength=len(STREAMS))
+        n_paths = np.bincount(by_stream, minlength=len(STREAMS))
+        share = np.where(per_stream[by_stream] > 0, path_votes / np.maximum(per_stream[by_stream], 1e-12), 1.0 / n_paths[by_stream])
+        paths = streams[by_stream] * share
+
+        stream_order = np.lexsort((np.arange(len(STREAMS)), -streams))
+        path_order = np.lexsort((np.arange(len(self.paths)), -paths))
+        return {
+            "streams": [(STREAMS[i], float(streams[i])) for i in stream_order],
+            "paths": [(*self.paths[i], float(paths[i])) for i in path_order],
+            "neighbours": int(used.sum()),
+        }
+
+def read_outcomes(path=OUTCOMES_PATH):
+    from advisor.data import read_table
+    return read_table(path)
@@ -0,0 +1,176 @@
+# advisor/results.py
+# Persistent quiz-result store (SQLite, WAL mode) with aggregate tables kept up
+# to date by triggers, plus a background writer that batches inserts.
+#
+# The app never writes on the rerun thread: it hands finished results to
+# ResultWriter.submit(), which only enqueues. Counselor views read the small
+# aggregate tables, so their cost doesn't grow with the number of results.
+
+import atexit
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+
+from advisor.quiz import STREAMS
+from advisor.sources import DATA_DIR
+
+RESULTS_DB_PATH = os.environ.get("RESULTS_DB_PATH", os.path.join(DATA_DIR, "quiz_results.sqlite3"))
+SCORE_COLUMNS = ["score_" + re.sub(r"\W+", "_", s.lower()) for s in STREAMS]
+RESULT_FIELDS = ["timestamp", "name", "student_class", "district", "suggested_stream"] + SCORE_COLUMNS
+# dimension -> aggregate table; each holds (key, suggested_stream, n)
+AGGREGATES = {"student_class": "stream_by_class", "district": "stream_by_district"}
+UNKNOWN_DISTRICT = "Unknown"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS quiz_results (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    name TEXT NOT NULL,
+    student_class TEXT NOT NULL,
+    district TEXT NOT NULL,
+    suggested_stream TEXT NOT NULL,
+    {", ".join(f"{c} INTEGER NOT NULL" for c in SCORE_COLUMNS)}
+);
+""" + "".join(f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    key TEXT NOT NULL,
+    suggested_stream TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (key, suggested_stream)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS {table}_insert AFTER INSERT ON quiz_results BEGIN
+    INSERT INTO {table} VALUES (NEW.{dim}, NEW.suggested_stream, 1)
+    ON CONFLICT (key, suggested_stream) DO UPDATE SET n = n + 1;
+END;
+""" for dim, table in AGGREGATES.items())
+
+def normalize_district(text):
+    text = " ".join(str(text or "").split())
+    return text.title() if text else UNKNOWN_DISTRICT
+
+def result_row(name, student_class, district, scores, best, timestamp=None):
+    """One quiz_results row from a scored quiz (scores: {stream: score})."""
+    timestamp = timestamp or time.strftime("%Y-%m-%d %H:%M:%S")
+    return (timestamp, (name or "").strip() or "Anonymous", student_class, normalize_district(district), best,
+            *(int(scores.get(s, 0)) for s in STREAMS))
+
+class ResultStore:
+    """Connection to the result database. One per thread; WAL lets readers run alongside the writer."""
+
+    def __init__(self, path=RESULTS_DB_PATH, readonly=False):
+        self.path = path
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=5)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self.conn = sqlite3.connect(path, timeout=30)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints; fine for quiz results
+            self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def insert_many(self, rows):
+        """Insert result rows (see result_row) in one transaction; aggregates update with them."""
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO quiz_results ({', '.join(RESULT_FIELDS)}) VALUES ({', '.join('?' * len(RESULT_FIELDS))})", rows)
+
+    def total(self):
+        return self.conn.execute("SELECT COALESCE(SUM(n), 0) FROM stream_by_class").fetchone()[0]
+
+    def stream_counts(self, dimension):
+        """{key: {stream: count}} from the aggregate table for `dimension` ("student_class" or "district")."""
+        out = {}
+        for key, stream, n in self.conn.execute(f"SELECT key, suggested_stream, n FROM {AGGREGATES[dimension]}"):
+            out.setdefault(key, {})[stream] = n
+        return out
+
+    def rebuild_aggregates(self):
+        """Recompute every aggregate table from quiz_results (after manual edits or restores)."""
+        with self.conn:
+            for dim, table in AGGREGATES.items():
+                self.conn.execute(f"DELETE FROM {table}")
+                self.conn.execute(f"INSERT INTO {table} SELECT {dim}, suggested_stream, COUNT(*) "
+                                  f"FROM quiz_results GROUP BY {dim}, suggested_stream")
+
+def read_store(path=RESULTS_DB_PATH):
+    """Read-only store, or None while nothing has been written yet."""
+    if not os.path.exists(path):
+        return None
+    return ResultStore(path, readonly=True)
+
+class ResultWriter:
+    """Background thread that drains submitted rows into the store in batches.
+
+    submit() never blocks: when the queue is full the row is counted in
+    `dropped` instead. Queued rows are written at interpreter exit.
+    """
+
+    def __init__(self, path=RESULTS_DB_PATH, batch_size=500, flush_seconds=0.5, max_queue=10_000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.queue = queue.Queue(max_queue)
+        self.written = self.dropped = self.failed = 0
+        self._stop = object()
+        ResultStore(path).close()  # create the schema before anyone can read it
+        self._thread = threading.Thread(target=self._run, name="quiz-result-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, row):
+        try:
+            self.queue.put_nowait(row)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def pending(self):
+        return self.queue.qsize()
+
+    def flush(self):
+        """Block until everything submitted so far is written."""
+        self.queue.join()
+
+    def close(self, timeout=5.0):
+        if self._thread.is_alive():
+            self.queue.put(self._stop)
+            self._thread.join(timeout)
+
+    def _run(self):
+        store = ResultStore(self.path)
+        stopping = False
+        while not stopping:
+            item = self.queue.get()
+            batch, taken = [], 1
+            if item is self._stop:
+                stopping = True
+            else:
+                batch.append(item)
+            deadline = time.monotonic() + self.flush_seconds
+            while not stopping and len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is self._stop:
+                    stopping = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    store.insert_many(batch)
+                    self.written += len(batch)
+            except sqlite3.Error:
+                self.failed += len(batch)
+            finally:
+                for _ in range(taken):
+                    self.queue.task_done()
+        store.close()
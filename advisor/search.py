@@ -0,0 +1,159 @@
+# advisor/search.py
+# Inverted index over the college directory with prefix and typo-tolerant matching.
+
+import re
+
+import numpy as np
+
+# Old/alternate spellings are folded onto one token at index and query time.
+SEARCH_ALIASES = {
+    "govt": "government", "bombay": "mumbai", "madras": "chennai", "calcutta": "kolkata",
+    "bangalore": "bengaluru", "poona": "pune", "trivandrum": "thiruvananthapuram", "baroda": "vadodara",
+    "mysore": "mysuru", "gurgaon": "gurugram", "cochin": "kochi", "benares": "varanasi", "banaras": "varanasi",
+    "allahabad": "prayagraj", "pondicherry": "puducherry", "simla": "shimla", "trichy": "tiruchirappalli",
+    "vizag": "visakhapatnam", "mangalore": "mangaluru", "belgaum": "belagavi", "orissa": "odisha",
+}
+SEARCH_FIELD_WEIGHTS = {"college_name": 3.0, "district": 2.0, "courses": 1.0}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_DOTTED_RE = re.compile(r"[a-z0-9]+(?:\.[a-z0-9]+)+")  # B.Sc, B.Tech -> also indexed as bsc, btech
+# transliteration variants common in Indian place names (Thiruvananthapuram / Tiruvanantapuram)
+_PHONETIC_RULES = [("ph", "f"), ("th", "t"), ("dh", "d"), ("bh", "b"), ("kh", "k"), ("gh", "g"),
+                   ("sh", "s"), ("ee", "i"), ("oo", "u"), ("w", "v"), ("z", "j"), ("y", "i")]
+
+def tokenize(text):
+    text = str(text).lower()
+    tokens = _WORD_RE.findall(text) + [m.replace(".", "") for m in _DOTTED_RE.findall(text)]
+    return [SEARCH_ALIASES.get(t, t) for t in tokens]
+
+def _trigrams(term):
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _phonetic_key(term):
+    for a, b in _PHONETIC_RULES:
+        term = term.replace(a, b)
+    return re.sub(r"(.)\1+", r"\1", term)
+
+class _Lookup:
+    """Sorted string keys -> int32 id lists in CSR form; a dict that can live in mapped arrays."""
+
+    def __init__(self, mapping):
+        keys = sorted(mapping)
+        self.keys = np.asarray(keys, dtype=str)
+        self.offsets = np.cumsum([0] + [len(mapping[k]) for k in keys], dtype=np.int64)
+        self.ids = np.asarray([i for k in keys for i in mapping[k]], dtype=np.int32)
+
+    def to_arrays(self):
+        return {"keys": self.keys, "offsets": self.offsets, "ids": self.ids}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        self = cls.__new__(cls)
+        self.keys, self.offsets, self.ids = arrays["keys"], arrays["offsets"], arrays["ids"]
+        return self
+
+    def get(self, key):
+        i = int(np.searchsorted(self.keys, key))
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.ids[self.offsets[i]:self.offsets[i + 1]]
+        return self.ids[:0]
+
+class SearchIndex:
+    """Inverted index over college name, district and courses.
+
+    Terms are kept sorted so a prefix is one contiguous slice of the postings;
+    unknown terms fall back to phonetic and trigram matches for typo tolerance.
+    """
+
+    def __init__(self, df, field_weights=SEARCH_FIELD_WEIGHTS):
+        postings, seen = {}, {}
+        for col, weight in field_weights.items():
+            for row, text in enumerate(df[col].astype(str).tolist()):
+                if text not in seen:  # districts and course lists repeat a lot
+                    seen[text] = set(tokenize(text))
+                for tok in seen[text]:
+                    rows = postings.setdefault(tok, {})
+                    if rows.get(row, 0) < weight:
+                        rows[row] = weight
+        self.n_rows = len(df)
+        terms = sorted(postings)
+        rows, weights, offsets = [], [], [0]
+        for term in terms:
+            hits = postings[term]
+            ordered = sorted(hits)
+            rows.extend(ordered)
+            weights.extend(hits[r] for r in ordered)
+            offsets.append(len(rows))
+        self.terms = np.asarray(terms, dtype=str)
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+        trigrams, phonetic = {}, {}
+        for tid, term in enumerate(terms):
+            for g in _trigrams(term):
+                trigrams.setdefault(g, []).append(tid)
+            phonetic.setdefault(_phonetic_key(term), []).append(tid)
+        self.trigrams = _Lookup(trigrams)
+        self.phonetic = _Lookup(phonetic)
+        self.trigram_counts = np.asarray([len(_trigrams(t)) for t in terms], dtype=np.int32)
+
+    def to_arrays(self):
+        arrays = {"terms": self.terms, "rows": self.rows, "weights": self.weights, "offsets": self.offsets,
+                  "trigram_counts": self.trigram_counts}
+        for name, lookup in (("trigrams", self.trigrams), ("phonetic", self.phonetic)):
+            arrays.update({f"{name}_{k}": v for k, v in lookup.to_arrays().items()})
+        return arrays, {"n_rows": self.n_rows}
+
+    @classmethod
+    def from_arrays(cls, arrays, meta):
+        """Terms, postings and both lookups stay mapped; nothing is re-tokenized."""
+        self = cls.__new__(cls)
+        self.n_rows = meta["n_rows"]
+        self.terms, self.rows, self.weights, self.offsets = arrays["terms"], arrays["rows"], arrays["weights"], arrays["offsets"]
+        self.trigram_counts = arrays["trigram_counts"]
+        self.trigrams = _Lookup.from_arrays({k: arrays[f"trigrams_{k}"] for k in ("keys", "offsets", "ids")})
+        self.phonetic = _Lookup.from_arrays({k: arrays[f"phonetic_{k}"] for k in ("keys", "offsets", "ids")})
+        return self
+
+    def _expand(self, term):
+        """(first_term_id, last_term_id + 1, match_score) ranges a query term resolves to."""
+        lo = int(np.searchsorted(self.terms, term, side="left"))
+        hi = int(np.searchsorted(self.terms, term + "\uffff", side="left"))
+        if hi > lo:
+            ranges = [(lo, hi, 0.8)]  # prefix
+            if self.terms[lo] == term:
+                ranges.append((lo, lo + 1, 1.0))
+            return ranges
+        ranges = []
+        if len(term) < 4:
+            return ranges
+        for tid in self.phonetic.get(_phonetic_key(term)).tolist():
+            ranges.append((tid, tid + 1, 0.9))
+        grams = [ids for ids in (self.trigrams.get(g) for g in _trigrams(term)) if len(ids)]
+        if grams:
+            shared = np.bincount(np.concatenate(grams), minlength=len(self.terms))
+            dice = 2.0 * shared / (len(_trigrams(term)) + self.trigram_counts)
+            close = np.flatnonzero(dice >= 0.5)
+            close = close[np.argsort(-dice[close], kind="stable")[:20]]
+            ranges.extend((int(t), int(t) + 1, 0.7 * float(dice[t])) for t in close)
+        return ranges
+
+    def search(self, query, limit=None):
+        """Row positions matching every query term, best first. The last term may be a prefix."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return np.arange(self.n_rows)
+        total = np.zeros(self.n_rows, dtype=np.float32)
+        matched = np.ones(self.n_rows, dtype=bool)
+        for term in terms:
+            score = np.zeros(self.n_rows, dtype=np.float32)
+            for lo, hi, m in self._expand(term):
+                a, b = self.offsets[lo], self.offsets[hi]
+                np.maximum.at(score, self.rows[a:b], self.weights[a:b] * m)
+            matched &= score > 0
+            total += score
+        hits = np.flatnonzero(matched)
+        hits = hits[np.argsort(-total[hits], kind="stable")]
+        return hits if limit is None else hits[:limit]
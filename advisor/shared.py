@@ -0,0 +1,210 @@
+# advisor/shared.py
+# Read-only snapshots of the college directory and timeline, memory-mapped by
+# every worker process on a node.
+#
+# A snapshot is an immutable directory SHARED_DATA_DIR/<dataset>/<version>/
+# holding the table as an uncompressed Arrow IPC file and each prebuilt index
+# as .npy arrays, described by manifest.json. Workers map the files instead of
+# reading them, so the bytes sit once in the page cache however many workers
+# run, and filter/search/geo queries read the mapped arrays directly. A version
+# is written to a temporary directory and renamed into place, so readers only
+# ever see complete snapshots; the first worker (or an import) to see a new
+# source version publishes it and everyone else just maps it.
+
+import argparse
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from advisor.sources import COLLEGES_PATH, SHARED_DATA_DIR, TIMELINE_PATH, active_source, source_version
+
+SHARED_KEEP_VERSIONS = 2  # published versions kept on disk per dataset, current included
+# dataset -> (source path, reader, {index name: (module, builder)}); builders are index
+# classes or functions returning {name: array}. An index class is built from the frame,
+# then saved via to_arrays() -> ({name: array}, JSON-able meta); workers get it back from
+# cls.from_arrays(arrays, meta) with the arrays memory-mapped, so from_arrays must keep
+# them as they are (no copies, no writes) and rebuild only small state from meta.
+DATASETS = {
+    "colleges": (COLLEGES_PATH, ("advisor.data", "read_colleges"), {
+        "facets": ("advisor.facets", "FacetIndex"),
+        "search": ("advisor.search", "SearchIndex"),
+        "geo": ("advisor.geo", "GeoIndex"),
+        "sort_ranks": ("advisor.sorting", "sort_ranks"),
+    }),
+    "timeline": (TIMELINE_PATH, ("advisor.data", "read_timeline"), {}),
+}
+
+_TABLE = "table.arrow"
+_MANIFEST = "manifest.json"
+_CURRENT = "CURRENT"
+_open, _open_lock = {}, threading.Lock()  # the lock guards _open and _version_locks only
+_version_locks = {}
+
+def _resolve(module, name):
+    return getattr(importlib.import_module(module), name)
+
+def snapshot_dir(dataset, version):
+    return os.path.join(SHARED_DATA_DIR, dataset, version)
+
+def current_version(dataset):
+    """Most recently published version of `dataset`, or None."""
+    try:
+        with open(os.path.join(SHARED_DATA_DIR, dataset, _CURRENT)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def _write_table(frame, path):
+    import pyarrow as pa
+    import pyarrow.ipc
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    for i, name in enumerate(table.column_names):
+        if frame[name].dtype.kind == "f":  # keep NaN as NaN, so readers can map floats without filling nulls
+            table = table.set_column(i, name, pa.array(frame[name].to_numpy(), from_pandas=False))
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table.combine_chunks())  # one record batch, so readers never concatenate
+
+def _read_frame(path):
+    """DataFrame over a mapped Arrow file: strings and floats stay in the mapping, categoricals copy only their codes."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.ipc
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    strings = pd.StringDtype("pyarrow")
+    return table.to_pandas(types_mapper=lambda t: strings if pa.types.is_string(t) or pa.types.is_large_string(t) else None)
+
+def _map_array(path):
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:  # empty arrays can't be mapped
+        return np.load(path)
+
+class Snapshot:
+    """One mapped version of a dataset: `frame` plus its prebuilt `indexes`."""
+
+    def __init__(self, path):
+        with open(os.path.join(path, _MANIFEST)) as f:
+            self.manifest = json.load(f)
+        self.path = path
+        self.version = self.manifest["version"]
+        self.frame = _read_frame(os.path.join(path, _TABLE))
+        # map every index now: an open mapping survives the directory being pruned later
+        self.indexes = {}
+        for key, spec in self.manifest["indexes"].items():
+            arrays = {a: _map_array(os.path.join(path, f"{key}.{i}.npy")) for i, a in enumerate(spec["arrays"])}
+            builder = _resolve(*spec["builder"])
+            self.indexes[key] = builder.from_arrays(arrays, spec["meta"]) if isinstance(builder, type) else arrays
+
+def publish(dataset, version, frame):
+    """Build the dataset's indexes over `frame` and publish them as `version`. Returns the snapshot directory.
+
+    Safe to race: if another process publishes the same version first, its copy is kept.
+    """
+    final = snapshot_dir(dataset, version)
+    if not os.path.exists(os.path.join(final, _MANIFEST)):
+        parent = os.path.dirname(final)
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=f".{version}.", dir=parent)
+        try:
+            _write_table(frame, os.path.join(tmp, _TABLE))
+            manifest = {"dataset": dataset, "version": version, "rows": len(frame),
+                        "published": time.strftime("%Y-%m-%d %H:%M:%S"), "indexes": {}}
+            for key, builder in DATASETS[dataset][2].items():
+                built = _resolve(*builder)(frame)
+                arrays, meta = built.to_arrays() if hasattr(built, "to_arrays") else (built, {})
+                for i, array in enumerate(arrays.values()):
+                    np.save(os.path.join(tmp, f"{key}.{i}.npy"), np.ascontiguousarray(array))
+                manifest["indexes"][key] = {"builder": list(builder), "arrays": list(arrays), "meta": meta}
+            with open(os.path.join(tmp, _MANIFEST), "w") as f:
+                json.dump(manifest, f)
+            os.chmod(tmp, 0o755)  # mkdtemp is owner-only; workers may run as another user than the publisher
+            try:
+                os.rename(tmp, final)
+            except OSError:
+                if not os.path.exists(os.path.join(final, _MANIFEST)):
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    pointer = os.path.join(SHARED_DATA_DIR, dataset, f".{_CURRENT}.{os.getpid()}")
+    with open(pointer, "w") as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(SHARED_DATA_DIR, dataset, _CURRENT))
+    prune(dataset)
+    return final
+
+def prune(dataset, keep=SHARED_KEEP_VERSIONS):
+    """Delete all but the `keep` newest versions (the current one always stays).
+
+    Workers still mapping a deleted version keep reading it until they move on.
+    """
+    root = os.path.join(SHARED_DATA_DIR, dataset)
+    current = current_version(dataset)
+    versions = [v for v in os.listdir(root) if not v.startswith(".") and os.path.isdir(os.path.join(root, v))]
+    versions.sort(key=lambda v: (v == current, os.path.getmtime(os.path.join(root, v))), reverse=True)
+    for v in versions[keep:]:
+        shutil.rmtree(os.path.join(root, v), ignore_errors=True)
+
+def open_snapshot(dataset, version, read=None):
+    """The mapped snapshot for `version`, publishing it first (from `read()`) if nobody has yet.
+
+    Opened snapshots are kept per process, the newest two per dataset. A publish only
+    holds up threads waiting for the same version.
+    """
+    key = (dataset, version)
+    with _open_lock:
+        snapshot = _open.get(key)
+        if snapshot is not None:
+            return snapshot
+        lock = _version_locks.setdefault(key, threading.Lock())
+    with lock:
+        snapshot = opened(dataset, version)  # another thread may have opened it while we waited
+        if snapshot is not None:
+            return snapshot
+        path = snapshot_dir(dataset, version)
+        if not os.path.exists(os.path.join(path, _MANIFEST)):
+            if read is None:
+                return None
+            publish(dataset, version, read())
+        snapshot = Snapshot(path)
+    with _open_lock:
+        _open[key] = snapshot
+        for old in [k for k in _open if k[0] == dataset][:-2]:
+            del _open[old]
+            _version_locks.pop(old, None)
+    return snapshot
+
+def opened(dataset, version):
+    """Already-open snapshot for `version`, or None."""
+    with _open_lock:
+        return _open.get((dataset, version))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish or list shared memory-mapped dataset snapshots.")
+    parser.add_argument("command", choices=["publish", "list"])
+    parser.add_argument("datasets", nargs="*", default=list(DATASETS), help=f"default: {' '.join(DATASETS)}")
+    args = parser.parse_args(argv)
+    for dataset in args.datasets:
+        path, reader, _ = DATASETS[dataset]
+        source = active_source(path)
+        if args.command == "publish":
+            version = source_version(source)
+            start = time.perf_counter()
+            out = publish(dataset, version, _resolve(*reader)(source))
+            print(f"{dataset}: published {version} from {source} to {out} in {time.perf_counter() - start:.1f}s")
+        else:
+            root = os.path.join(SHARED_DATA_DIR, dataset)
+            versions = sorted(v for v in os.listdir(root) if not v.startswith(".")) if os.path.isdir(root) else []
+            current = current_version(dataset)
+            print(f"{dataset}: " + (", ".join(f"{v}{' (current)' if v == current else ''}"
+                                              for v in versions if v != _CURRENT) or "nothing published"))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
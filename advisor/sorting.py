@@ -0,0 +1,16 @@
+# advisor/sorting.py
+# Precomputed sort ranks, so ordering a result set is one argsort over ints.
+
+import numpy as np
+
+COLLEGE_SORTS = {"Name (A-Z)": ["college_name"], "State, district, name": ["state", "district", "college_name"]}
+
+def sort_ranks(df, sorts=COLLEGE_SORTS):
+    """Row position -> rank for each sort option; ties keep directory order."""
+    ranks = {}
+    for label, cols in sorts.items():
+        order = df.sort_values(cols, kind="stable", key=lambda s: s.astype(str).str.lower()).index.to_numpy()
+        rank = np.empty(len(df), dtype=np.int64)
+        rank[order] = np.arange(len(df))
+        ranks[label] = rank
+    return ranks
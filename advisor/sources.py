@@ -0,0 +1,47 @@
+# advisor/sources.py
+# Where the app's data lives and how its versions are tracked. Standard library
+# only, so checking whether a source changed never imports pandas.
+
+import functools
+import hashlib
+import os
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(APP_DIR, "data")
+COLLEGES_PATH = os.environ.get("COLLEGES_PATH", os.path.join(DATA_DIR, "colleges.csv"))
+TIMELINE_PATH = os.environ.get("TIMELINE_PATH", os.path.join(DATA_DIR, "timeline.csv"))
+PINCODES_PATH = os.environ.get("PINCODES_PATH", os.path.join(DATA_DIR, "pincodes.csv"))
+CUTOFFS_PATH = os.environ.get("CUTOFFS_PATH", os.path.join(DATA_DIR, "cutoffs.csv"))
+# memory-mapped snapshots of the directory and timeline shared by worker processes (advisor/shared.py)
+SHARED_DATA_DIR = os.environ.get("SHARED_DATA_DIR", os.path.join(DATA_DIR, "shared"))
+SHARED_DATA_ENABLED = os.environ.get("ADVISOR_SHARED_DATA", "1") != "0"
+
+COLLEGE_COLUMNS = ["college_name", "district", "state", "streams", "courses", "facilities", "contact"]
+GEO_COLUMNS = ["latitude", "longitude"]  # optional; colleges without them are left out of "near me"
+CATEGORICAL_COLUMNS = ["state", "district"]
+TIMELINE_COLUMNS = ["event", "start_date", "end_date", "type"]
+# one closing rank per college, course, reservation category, counselling round and year;
+# colleges are matched to the directory by (college_name, district)
+CUTOFF_COLUMNS = ["college_name", "district", "course", "category", "round", "year", "closing_rank"]
+
+@functools.lru_cache(maxsize=16)
+def _file_digest(path, mtime_ns, size):
+    # keyed by mtime/size so the file is only re-hashed after it is touched
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def source_version(path):
+    """Content hash of a data file; changes only when the bytes change."""
+    stat = os.stat(path)
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+def store_path(path):
+    """Columnar store that shadows a CSV source once uploads have been ingested into it."""
+    return os.path.splitext(path)[0] + ".parquet"
+
+def active_source(path):
+    parquet = store_path(path)
+    return parquet if os.path.exists(parquet) else path
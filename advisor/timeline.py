@@ -0,0 +1,124 @@
+# advisor/timeline.py
+# Start-sorted timeline index for open-now/upcoming/range queries, plus the .ics writer.
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+def _to_days(values):
+    """Dates/strings -> int64 days since 1970-01-01 (NaT becomes the int64 minimum)."""
+    return pd.to_datetime(values, errors="coerce").to_numpy(dtype="datetime64[D]").astype(np.int64)
+
+def day_number(day):
+    return np.datetime64(day, "D").astype(np.int64)
+
+class TimelineIndex:
+    """Events sorted by start day, with their end days alongside.
+
+    Queries bisect start days. For open/overlap queries, events are also split
+    into start-sorted runs per (type, span bucket), where bucket k holds spans
+    below 2**k days: everything in a run that can be open on a day starts at
+    most the run's longest span earlier, so one long event only widens the
+    window of its own run. Positions returned are in overall start order.
+    """
+
+    def __init__(self, df):
+        start = _to_days(df["start_date"])
+        end = _to_days(df["end_date"])
+        nat = np.iinfo(np.int64).min
+        end = np.where(end == nat, start, end)
+        valid = np.flatnonzero(start != nat)
+        order = valid[np.lexsort((valid, start[valid]))]
+        self.start = start[order]
+        self.end = np.maximum(end[order], self.start)
+        events = df.iloc[order]
+        self.table = pd.DataFrame({
+            "event": events["event"].astype(str).to_numpy(),
+            "start_date": self.start.astype("datetime64[D]").astype(object),
+            "end_date": self.end.astype("datetime64[D]").astype(object),
+            "type": events["type"].astype(str).to_numpy(),
+        })
+        kinds = self.table["type"].to_numpy()
+        self.types = sorted(set(kinds))
+        # per type: positions and their start days, both in start order
+        self._by_type = {t: np.flatnonzero(kinds == t) for t in self.types}
+        self._type_start = {t: self.start[pos] for t, pos in self._by_type.items()}
+        # per type: [(positions, starts, ends, longest span)] for each span bucket
+        span = self.end - self.start
+        bucket = np.ceil(np.log2(span + 1)).astype(np.int64)
+        self._runs = {}
+        for t, pos in self._by_type.items():
+            runs = []
+            for b in np.unique(bucket[pos]):
+                run = pos[bucket[pos] == b]
+                runs.append((run, self.start[run], self.end[run], int(span[run].max())))
+            self._runs[t] = runs
+
+    def overlapping(self, first, last, types=None):
+        """Positions (start order) of events overlapping [first, last], both inclusive."""
+        first, last = day_number(first), day_number(last)
+        found = []
+        for t in self.types if types is None else types:
+            for pos, start, end, max_span in self._runs.get(t, ()):
+                lo = np.searchsorted(start, first - max_span, side="left")
+                hi = np.searchsorted(start, last, side="right")
+                found.append(pos[lo:hi][end[lo:hi] >= first])
+        return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.int64)
+
+    def open_on(self, day, types=None):
+        """Events whose window includes `day`."""
+        return self.overlapping(day, day, types)
+
+    def upcoming(self, day, n=None, within_days=None, types=None):
+        """Events starting on or after `day` (optionally within N days), soonest first."""
+        first = day_number(day)
+        last = None if within_days is None else first + int(within_days)
+
+        def window(start):
+            lo = np.searchsorted(start, first, side="left")
+            hi = len(start) if last is None else np.searchsorted(start, last, side="right")
+            return lo, hi if n is None else min(hi, lo + n)
+
+        if types is None:
+            return np.arange(*window(self.start))
+        found = [self._by_type[t][slice(*window(self._type_start[t]))] for t in types if t in self._by_type]
+        pos = np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.int64)
+        return pos if n is None else pos[:n]
+
+def _ical_text(value):
+    return str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def _ical_fold(line):
+    """Fold a content line at 75 octets as RFC 5545 requires."""
+    out, width = [], 0
+    for ch in line:
+        size = len(ch.encode("utf-8"))
+        if width + size > 75:
+            out.append("\r\n ")
+            width = 1
+        out.append(ch)
+        width += size
+    return "".join(out) + "\r\n"
+
+def iter_ical(events, name="Career & Education Advisor"):
+    """Yield an all-day VCALENDAR for `events` (event, start_date, end_date, type) line by line."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Career & Education Advisor//Timeline//EN\r\n"
+    yield _ical_fold(f"X-WR-CALNAME:{_ical_text(name)}")
+    for row in events.itertuples(index=False):
+        uid = hashlib.blake2b(f"{row.event}|{row.start_date}|{row.type}".encode("utf-8"), digest_size=12).hexdigest()
+        yield "BEGIN:VEVENT\r\n"
+        yield f"UID:{uid}@career-advisor\r\nDTSTAMP:{stamp}\r\n"
+        yield f"DTSTART;VALUE=DATE:{row.start_date:%Y%m%d}\r\n"
+        yield f"DTEND;VALUE=DATE:{row.end_date + timedelta(days=1):%Y%m%d}\r\n"  # exclusive end
+        yield _ical_fold(f"SUMMARY:{_ical_text(row.event)}")
+        yield _ical_fold(f"CATEGORIES:{_ical_text(row.type)}")
+        yield "END:VEVENT\r\n"
+    yield "END:VCALENDAR\r\n"
+
+def write_ical(events, fileobj, name="Career & Education Advisor"):
+    for chunk in iter_ical(events, name):
+        fileobj.write(chunk.encode("utf-8"))
+    return fileobj
@@ -0,0 +1,271 @@
+# benchmarks/run_benchmarks.py
+# Headless benchmark of every page plus the individual data stages, on synthetic data.
+# Run from the repo root:
+#   python -m benchmarks.run_benchmarks --sizes 1000,10000,100000 -o bench.json
+#   python -m benchmarks.run_benchmarks --baseline bench.json   # compare against a previous run
+#
+# Every (size, page) case and every stage set runs in a fresh process, so peak RSS
+# is per case and one case's caches never warm another's.
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from io import BytesIO
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(APP_DIR, "SIH.py")
+CUTOFF_COLLEGES = 20_000  # colleges given synthetic cut-offs (about 90 rows each)
+
+PAGES = {
+    "page_home": "Home",
+    "page_quiz": "Quiz",
+    "page_roadmap": "Course → Career",
+    "page_colleges": "Colleges Directory",
+    "page_timeline": "Timeline",
+    "page_resources_faqs": "Resources & FAQs",
+    "page_counselor": "Counselor Dashboard",
+    "page_about": "About",
+}
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def median_time(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return statistics.median(times)
+
+def write_dataset(rows, out_dir, timeline_rows=None, seed=0):
+    """Synthetic colleges/timeline files in the app's store format; returns the env that points the app at them."""
+    from benchmarks import synthetic
+    colleges = synthetic.colleges(rows, seed)
+    colleges.to_parquet(os.path.join(out_dir, "colleges.parquet"), index=False)
+    synthetic.timeline(timeline_rows or max(100, rows // 10), seed).to_parquet(os.path.join(out_dir, "timeline.parquet"), index=False)
+    synthetic.quiz_responses(rows, seed).to_csv(os.path.join(out_dir, "responses.csv"), index=False)
+    synthetic.outcomes(rows, seed).to_parquet(os.path.join(out_dir, "outcomes.parquet"), index=False)
+    synthetic.cutoffs(colleges.iloc[:CUTOFF_COLLEGES], seed).to_parquet(os.path.join(out_dir, "cutoffs.parquet"), index=False)
+    return {
+        "COLLEGES_PATH": os.path.join(out_dir, "colleges.parquet"),
+        "TIMELINE_PATH": os.path.join(out_dir, "timeline.parquet"),
+        "PINCODES_PATH": os.path.join(out_dir, "pincodes.csv"),  # absent: PIN lookup disabled
+        "RESULTS_DB_PATH": os.path.join(out_dir, "quiz_results.sqlite3"),
+        "OUTCOMES_PATH": os.path.join(out_dir, "outcomes.parquet"),
+        "CUTOFFS_PATH": os.path.join(out_dir, "cutoffs.parquet"),
+        "SHARED_DATA_DIR": os.path.join(out_dir, "shared"),
+    }
+
+def element_count(at):
+    return sum(1 for _ in at.main) + sum(1 for _ in at.sidebar)
+
+def _timed_run(at, timeout):
+    t = time.perf_counter()
+    at.run(timeout=timeout)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return time.perf_counter() - t
+
+def page_case(env, page, timeout=600):
+    """Drive one page through AppTest: first load, cold page render, warm rerun and page-specific interactions."""
+    os.environ.update(env)
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    result = {"page": page, "app_load_s": _timed_run(at, timeout)}
+    at.sidebar.radio[0].set_value(PAGES[page])
+    result["cold_rerun_s"] = _timed_run(at, timeout)
+    result["warm_rerun_s"] = _timed_run(at, timeout)
+    result["elements"] = element_count(at)
+    if page == "page_colleges":
+        at.text_input[0].set_value("govt science")
+        result["search_rerun_s"] = _timed_run(at, timeout)
+        at.text_input[0].set_value("")
+        _timed_run(at, timeout)
+        if at.number_input(key="college_page").max > 1:
+            at.number_input(key="college_page").set_value(2)
+            result["next_page_rerun_s"] = _timed_run(at, timeout)
+        at.radio(key="college_view").set_value("Table")
+        result["table_mode_rerun_s"] = _timed_run(at, timeout)
+        result["table_mode_elements"] = element_count(at)
+    elif page == "page_quiz":
+        at.main.button[0].click()
+        result["submit_rerun_s"] = _timed_run(at, timeout)
+        at.main.button[0].click()
+        result["resubmit_rerun_s"] = _timed_run(at, timeout)
+        result["result_elements"] = element_count(at)
+    elif page == "page_timeline":
+        at.multiselect(key="timeline_types").set_value(["Exam"])
+        result["type_filter_rerun_s"] = _timed_run(at, timeout)
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+def stage_case(env):
+    """Time the data stages behind the pages directly, outside of any rerun."""
+    os.environ.update(env)
+    sys.path.insert(0, APP_DIR)
+    import numpy as np
+    import pandas as pd
+    from advisor import bulk_import, quiz, shared, sources
+    from advisor.content import read_content
+    from advisor.cutoffs import CutoffIndex
+    from advisor.data import read_colleges, read_cutoffs, read_table
+    from advisor.export import write_export
+    from advisor.facets import FacetIndex
+    from advisor.geo import GeoIndex
+    from advisor.recommender import OUTCOMES_PATH, StreamRecommender
+    from advisor.search import SearchIndex
+    from advisor.sorting import sort_ranks
+    from advisor.timeline import TimelineIndex
+    from benchmarks import synthetic
+
+    stages = {}
+    path = sources.active_source(sources.COLLEGES_PATH)
+    stages["load"] = median_time(lambda: read_colleges(path), 3)
+    df = read_colleges(path)
+    stages["facet_index_build"] = median_time(lambda: FacetIndex(df), 1)
+    stages["search_index_build"] = median_time(lambda: SearchIndex(df), 1)
+    stages["geo_index_build"] = median_time(lambda: GeoIndex(df), 1)
+    facets, search, geo = FacetIndex(df), SearchIndex(df), GeoIndex(df)
+    selection = {"streams": "Science", "state": synthetic.STATES[0], "courses": "All", "facilities": ["Hostel"]}
+    stages["filter"] = median_time(lambda: facets.mask(selection))
+    stages["facet_counts"] = median_time(lambda: [facets.counts(c, selection) for c in ("streams", "state", "courses")])
+    stages["search"] = median_time(lambda: search.search("govt science college"))
+    stages["search_prefix"] = median_time(lambda: search.search("engin"))
+    stages["search_fuzzy"] = median_time(lambda: search.search("polytecnic"))
+    stages["sort_ranks_build"] = median_time(lambda: sort_ranks(df), 1)
+    rank = sort_ranks(df)["Name (A-Z)"]
+    rows = np.arange(len(df))
+    stages["sort"] = median_time(lambda: rows[np.argsort(rank[rows], kind="stable")])
+    stages["geo_nearest"] = median_time(lambda: geo.nearest(21.0, 78.0, 10))
+    stages["geo_within_50km"] = median_time(lambda: geo.within(21.0, 78.0, 50))
+    stages["snapshot_publish"] = median_time(lambda: shared.publish("colleges", "bench", df), 1)
+    stages["snapshot_open"] = median_time(lambda: shared.Snapshot(shared.snapshot_dir("colleges", "bench")), 3)
+    for fmt in ("CSV", "CSV (gzip)", "Parquet"):
+        stages[f"export_{fmt.lower().replace(' ', '_').replace('(', '').replace(')', '')}"] = median_time(
+            lambda fmt=fmt: write_export(df, fmt, BytesIO()), 1)
+    timeline_df = read_table(sources.active_source(sources.TIMELINE_PATH))
+    stages["timeline_index_build"] = median_time(lambda: TimelineIndex(timeline_df), 1)
+    tl = TimelineIndex(timeline_df)
+    stages["timeline_open_now"] = median_time(lambda: tl.open_on(date(2025, 6, 1)))
+    stages["timeline_upcoming"] = median_time(lambda: tl.upcoming(date(2025, 6, 1), n=10))
+    responses = pd.read_csv(os.path.join(os.path.dirname(path), "responses.csv"), dtype="string")
+    stages["quiz_batch_score"] = median_time(lambda: quiz.score_responses(responses), 1)
+    history = read_table(OUTCOMES_PATH)
+    roadmaps = read_content()["roadmaps"]
+    stages["recommender_build"] = median_time(lambda: StreamRecommender(history, roadmaps), 1)
+    recommender = StreamRecommender(history, roadmaps)
+    answers = [options[0] for _, _, options in quiz.QUIZ_QUESTIONS]
+    stages["recommend"] = median_time(lambda: recommender.recommend(answers, "Class 12", 75), 20)
+    cutoffs_path = sources.active_source(sources.CUTOFFS_PATH)
+    stages["cutoffs_load"] = median_time(lambda: read_cutoffs(cutoffs_path), 1)
+    cutoffs = read_cutoffs(cutoffs_path)
+    stages["cutoff_index_build"] = median_time(lambda: CutoffIndex(cutoffs, df), 1)
+    cutoff_index = CutoffIndex(cutoffs, df)
+    in_state = facets.mask({"streams": "All", "state": synthetic.STATES[0], "courses": "All", "facilities": []})
+    stages["cutoff_query_state"] = median_time(lambda: cutoff_index.by_college(*cutoff_index.eligible(20_000, "OBC", allowed=in_state)))
+    stages["cutoff_query_exact"] = median_time(lambda: cutoff_index.eligible(20_000, "GEN", 1, cutoff_index.years[0], allowed=in_state))
+    # one process: isolated cases run in a daemonic worker, which cannot start a pool
+    state_rows, _ = synthetic.state_lists(len(df))
+    state_rows = state_rows.assign(source="bench", line=np.arange(len(state_rows)) + 2)
+    stages["bulk_import_merge"] = median_time(
+        lambda: bulk_import.merge_colleges(state_rows, workers=1, progress=lambda msg: None), 1)
+    return {"stages": stages, "peak_rss_mb": peak_rss_mb()}
+
+def _run_isolated(fn, *args):
+    with mp.get_context("spawn").Pool(1) as pool:
+        return pool.apply(fn, args)
+
+def run(sizes, pages, with_stages=True):
+    results = []
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = write_dataset(rows, tmp)
+            if with_stages:
+                out = _run_isolated(stage_case, env)
+                results.append({"rows": rows, "case": "stages", **out})
+                print(f"[{rows:>9,} rows] stages done", file=sys.stderr)
+            for page in pages:
+                out = _run_isolated(page_case, env, page)
+                results.append({"rows": rows, "case": page, **out})
+                print(f"[{rows:>9,} rows] {page}: warm rerun {out['warm_rerun_s'] * 1e3:.0f} ms, "
+                      f"{out['elements']} elements", file=sys.stderr)
+    return results
+
+def environment():
+    import numpy, pandas, streamlit
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        rev = ""
+    return {"git_rev": rev, "python": platform.python_version(), "platform": platform.platform(),
+            "pandas": pandas.__version__, "numpy": numpy.__version__, "streamlit": streamlit.__version__,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def _metrics(report):
+    """Flatten a report into {"rows/case/metric": value} for comparison."""
+    flat = {}
+    for r in report["results"]:
+        values = dict(r.get("stages", {}))
+        values.update({k: v for k, v in r.items() if isinstance(v, (int, float)) and k != "rows"})
+        for metric, value in values.items():
+            if value is not None:
+                flat[f"{r['rows']}/{r['case']}/{metric}"] = value
+    return flat
+
+def compare(current, baseline, tolerance):
+    """Print metrics that moved by more than `tolerance`x; returns the number of regressions."""
+    now, before = _metrics(current), _metrics(baseline)
+    regressions = 0
+    for key in sorted(now.keys() & before.keys()):
+        if not before[key]:
+            continue
+        ratio = now[key] / before[key]
+        if ratio > tolerance or ratio < 1 / tolerance:
+            worse = ratio > tolerance
+            regressions += worse
+            print(f"{'REGRESSED' if worse else 'improved ':>9} {key}: {before[key]:.4g} -> {now[key]:.4g} ({ratio:.2f}x)")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the app's pages and data stages on synthetic data.")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated directory sizes (e.g. 1000,1000000)")
+    parser.add_argument("--pages", default=",".join(PAGES), help="comma-separated page functions to drive")
+    parser.add_argument("--no-stages", action="store_true", help="skip the direct stage timings")
+    parser.add_argument("-o", "--output", default="-", help="JSON report path (default: stdout)")
+    parser.add_argument("--baseline", help="previous JSON report to diff against")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="ratio beyond which a metric counts as changed")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    pages = [p for p in args.pages.split(",") if p]
+    unknown = [p for p in pages if p not in PAGES]
+    if unknown:
+        parser.error(f"unknown pages: {', '.join(unknown)}")
+    report = {"environment": environment(), "results": run(sizes, pages, not args.no_stages)}
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            return 1 if compare(report, json.load(f), args.tolerance) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+# benchmarks/synthetic.py
+# Synthetic college directories, timeline calendars and quiz responses for benchmarking.
+# Shapes match data/colleges.csv, data/timeline.csv and quiz_engine's responses CSV.
+
+import numpy as np
+import pandas as pd
+
+from advisor.quiz import CLASS_OPTIONS, QUIZ_QUESTIONS
+
+STATES = [
+    "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh", "Delhi", "Goa", "Gujarat",
+    "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka", "Kerala", "Madhya Pradesh", "Maharashtra",
+    "Manipur", "Meghalaya", "Mizoram", "Nagaland", "Odisha", "Punjab", "Rajasthan", "Sikkim", "Tamil Nadu",
+    "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal", "Jammu and Kashmir", "Ladakh",
+    "Puducherry", "Chandigarh", "Lakshadweep", "Andaman and Nicobar Islands", "Dadra and Nagar Haveli",
+]
+KINDS = ["Science", "Arts", "Commerce", "Arts & Science", "Women's", "Polytechnic", "Institute of Technology",
+         "Degree", "Engineering", "Medical", "Law", "Education", "Fine Arts", "Agriculture"]
+STREAMS = ["Science", "Computer Science", "Mathematics", "Commerce", "Management", "Arts", "Humanities",
+           "Journalism", "Vocational", "Engineering Diploma", "Engineering", "Medicine", "Law", "Education"]
+COURSES = ["B.Sc Physics", "B.Sc Chemistry", "B.Sc Mathematics", "B.Sc Computer Science", "B.Com", "BBA", "BA English",
+           "BA Psychology", "BA History", "BA Economics", "BJMC", "Diploma Civil", "Diploma Mechanical",
+           "Diploma Electrical", "B.Tech CSE", "B.Tech ECE", "B.Tech Mechanical", "MBBS", "LLB", "B.Ed", "BFA", "B.Sc Agriculture"]
+FACILITIES = ["Hostel", "Labs", "Library", "Internet", "WiFi", "Career Cell", "Theatre", "Workshops", "Placement Cell",
+              "Sports Ground", "Canteen", "Transport"]
+EVENT_TYPES = ["Exam", "Exam/Admission", "Scholarship", "Counseling", "Admission"]
+
+def _join(rng, pool, n, low, high, sep):
+    """n random sep-joined subsets of pool with low..high items each."""
+    counts = rng.integers(low, high + 1, n)
+    picks = np.argsort(rng.random((n, len(pool))), axis=1)
+    pool = np.asarray(pool, dtype=object)
+    return [sep.join(pool[picks[i, :counts[i]]]) for i in range(n)]
+
+def colleges(n, seed=0, districts_per_state=20):
+    """Directory with n colleges spread over ~districts_per_state districts per state."""
+    rng = np.random.default_rng(seed)
+    n_districts = len(STATES) * districts_per_state
+    district_state = np.repeat(np.arange(len(STATES)), districts_per_state)
+    district_lat = rng.uniform(8.0, 34.0, n_districts)
+    district_lon = rng.uniform(69.0, 96.0, n_districts)
+    d = rng.integers(0, n_districts, n)
+    district_names = np.array([f"District {i:03d}" for i in range(n_districts)], dtype=object)
+    kinds = np.asarray(KINDS, dtype=object)[rng.integers(0, len(KINDS), n)]
+    return pd.DataFrame({
+        "college_name": [f"Govt. {k} College {i}, {dn}" for i, (k, dn) in enumerate(zip(kinds, district_names[d]))],
+        "district": district_names[d],
+        "state": np.asarray(STATES, dtype=object)[district_state[d]],
+        "streams": _join(rng, STREAMS, n, 1, 3, ","),
+        "courses": _join(rng, COURSES, n, 2, 5, "; "),
+        "facilities": _join(rng, FACILITIES, n, 1, 5, ", "),
+        "contact": [f"0{rng.integers(100, 999)}-xxxx-xxxx" for _ in range(n)],
+        "latitude": (district_lat[d] + rng.normal(0, 0.15, n)).round(5),
+        "longitude": (district_lon[d] + rng.normal(0, 0.15, n)).round(5),
+    })
+
+def _respell(rng, names):
+    """Spelling variants state lists use: Govt/Government, dropped commas, a swapped letter, odd spacing and case."""
+    out = []
+    for name in names:
+        if rng.random() < 0.5:
+            name = name.replace("Govt.", "Government")
+        if rng.random() < 0.5:
+            name = name.replace(",", "")
+        i = int(rng.integers(10, len(name) - 1))
+        if rng.random() < 0.3 and name[i:i + 2].isalpha():  # numbers are never mistyped: they tell colleges apart
+            name = name[:i] + name[i + 1] + name[i] + name[i + 2:]
+        if rng.random() < 0.2:
+            name = "  " + name.upper()
+        out.append(name)
+    return out
+
+def state_lists(n, dup_rate=0.3, seed=0, districts_per_state=20):
+    """n rows merged from overlapping state lists: `colleges` plus respelled duplicates of dup_rate of them.
+
+    Duplicates spell the name and district differently, reorder and re-case their lists and
+    drop the contact or coordinates. Returns (rows, true cluster id per row).
+    """
+    rng = np.random.default_rng(seed)
+    base = colleges(int(round(n / (1 + dup_rate))), seed, districts_per_state)
+    picked = rng.choice(len(base), n - len(base), replace=True)
+    dups = base.iloc[picked].reset_index(drop=True)
+    dups["college_name"] = _respell(rng, dups["college_name"])
+    dups["district"] = np.where(rng.random(len(dups)) < 0.5, dups["district"] + " District", dups["district"].str.lower())
+    dups["streams"] = [";".join(reversed(s.split(","))) for s in dups["streams"]]
+    dups["courses"] = dups["courses"].str.upper()
+    dups.loc[rng.random(len(dups)) < 0.5, "contact"] = ""
+    dups.loc[rng.random(len(dups)) < 0.3, ["latitude", "longitude"]] = np.nan
+    rows = pd.concat([base, dups], ignore_index=True)
+    order = rng.permutation(len(rows))
+    truth = np.concatenate([np.arange(len(base)), picked])[order]
+    return rows.iloc[order].reset_index(drop=True), truth
+
+def timeline(n, seed=0, year=2025):
+    """n events over one year, lasting 0-90 days."""
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp(f"{year}-01-01") + pd.to_timedelta(rng.integers(0, 365, n), "D")
+    end = start + pd.to_timedelta(rng.integers(0, 91, n), "D")
+    kinds = np.asarray(EVENT_TYPES, dtype=object)[rng.integers(0, len(EVENT_TYPES), n)]
+    states = np.asarray(STATES, dtype=object)[rng.integers(0, len(STATES), n)]
+    return pd.DataFrame({
+        "event": [f"{s} {k} window {i}" for i, (s, k) in enumerate(zip(states, kinds))],
+        "start_date": start.strftime("%Y-%m-%d"),
+        "end_date": end.strftime("%Y-%m-%d"),
+        "type": kinds,
+    })
+
+CATEGORIES = {"GEN": 1.0, "EWS": 1.2, "OBC": 1.5, "SC": 3.0, "ST": 4.0}  # closing-rank multipliers
+
+def cutoffs(colleges, seed=0, years=(2023, 2024), rounds=3):
+    """Closing ranks for every course of every college in `colleges`, per category, round and year.
+
+    Later rounds and reserved categories close at higher (more lenient) ranks.
+    """
+    rng = np.random.default_rng(seed)
+    courses = colleges["courses"].astype(str).str.split(";").explode().str.strip()
+    courses = courses[courses != ""]
+    pairs = pd.DataFrame({"college_name": colleges["college_name"].to_numpy()[courses.index],
+                          "district": colleges["district"].astype(str).to_numpy()[courses.index],
+                          "course": courses.to_numpy(),
+                          "base": rng.uniform(500, 60_000, len(courses))})
+    grid = pd.MultiIndex.from_product([list(CATEGORIES), range(1, rounds + 1), years],
+                                      names=["category", "round", "year"]).to_frame(index=False)
+    out = pairs.merge(grid, how="cross")
+    factor = out["category"].map(CATEGORIES) * (1 + 0.15 * (out["round"] - 1)) * rng.uniform(0.9, 1.1, len(out))
+    out["closing_rank"] = (out["base"] * factor).round().astype("int64")
+    return out.drop(columns="base")
+
+def outcomes(n, seed=0, noise=0.2):
+    """n historical students (class, q1..q5, marks, stream, path) for the recommender.
+
+    Each student leans towards the stream they went on to study: an answer picks
+    that stream's option 60% of the time, and `noise` of outcomes are random.
+    """
+    from advisor.quiz import QUIZ_MAPPING, STREAMS as QUIZ_STREAMS
+    from advisor.content import read_content
+    from advisor.recommender import roadmap_paths
+    rng = np.random.default_rng(seed)
+    latent = rng.integers(0, len(QUIZ_STREAMS), n)
+    out = pd.DataFrame({
+        "class": np.asarray(CLASS_OPTIONS, dtype=object)[rng.integers(0, len(CLASS_OPTIONS), n)],
+    })
+    for col, _, options in QUIZ_QUESTIONS:
+        leaning = np.array([[o for o in options if QUIZ_MAPPING.get(o) == s][0] for s in QUIZ_STREAMS], dtype=object)
+        random = np.asarray(options, dtype=object)[rng.integers(0, len(options), n)]
+        out[col] = np.where(rng.random(n) < 0.6, leaning[latent], random)
+    marks = rng.normal(65, 15, n).clip(20, 100).round()
+    out["marks"] = np.where(rng.random(n) < 0.8, marks, np.nan)  # some students didn't report marks
+    stream = np.where(rng.random(n) < noise, rng.integers(0, len(QUIZ_STREAMS), n), latent)
+    out["stream"] = np.asarray(QUIZ_STREAMS, dtype=object)[stream]
+    degrees = {s: [degree for stream, degree in roadmap_paths(read_content()["roadmaps"]) if stream == s] for s in QUIZ_STREAMS}
+    out["path"] = [degrees[s][rng.integers(0, len(degrees[s]))] for s in out["stream"]]
+    return out
+
+def quiz_responses(n, seed=0):
+    """n students' answers in quiz_engine's responses layout (name, class, q1..q5)."""
+    rng = np.random.default_rng(seed)
+    out = pd.DataFrame({
+        "name": [f"Student {i}" for i in range(n)],
+        "class": np.asarray(CLASS_OPTIONS, dtype=object)[rng.integers(0, len(CLASS_OPTIONS), n)],
+    })
+    for col, _, options in QUIZ_QUESTIONS:
+        out[col] = np.asarray(options, dtype=object)[rng.integers(0, len(options), n)]
+    return out
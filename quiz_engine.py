@@ -0,0 +1,10 @@
+# quiz_engine.py
+# Batch entry point for quiz scoring; the engine lives in advisor/quiz.py.
+# Run: python quiz_engine.py responses.csv -o results.csv
+
+import sys
+
+from advisor.quiz import main
+
+if __name__ == "__main__":
+    sys.exit(main())
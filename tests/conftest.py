@@ -0,0 +1,6 @@
+# tests/conftest.py
+# Run from anywhere: `pytest` or `python -m pytest` from the repo root.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
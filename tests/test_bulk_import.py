@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from advisor.bulk_import import district_key, merge_colleges, name_key, read_lists
+from benchmarks import synthetic
+
+def _rows(*records):
+    df = pd.DataFrame(records, columns=["college_name", "district", "state", "streams", "courses", "facilities",
+                                        "contact", "latitude", "longitude"])
+    return df.assign(source="test.csv", line=np.arange(len(df)) + 2)
+
+def test_normalized_keys():
+    assert name_key("Govt. Science College, Chennai", ["chennai"]) == name_key("Government Science College Chennai", ["chennai"])
+    assert district_key("Chennai District") == district_key("chennai")
+    assert district_key("Tiruvanantapuram") == district_key("Thiruvananthapuram")
+
+def test_spelling_variants_merge_and_lists_are_unioned():
+    rows = _rows(
+        ("Govt. Science College, Chennai", "Chennai", "Tamil Nadu", "Science", "B.Sc Physics", "Hostel", "044-1", 13.0, 80.2),
+        ("Government Science Colege Chennai", "Chennai District", "tamil nadu", "Science;Arts", "b.sc physics; BA", "",
+         "", np.nan, np.nan),
+    )
+    directory, report = merge_colleges(rows, workers=1, progress=lambda msg: None)
+    assert len(directory) == 1 and len(report) == 1
+    kept = directory.iloc[0]
+    assert (kept["college_name"], kept["district"], kept["state"]) == ("Govt. Science College, Chennai", "Chennai", "Tamil Nadu")
+    assert kept["streams"] == "Science,Arts" and kept["courses"] == "B.Sc Physics; BA"
+    assert kept["contact"] == "044-1" and kept["latitude"] == 13.0
+    assert report.iloc[0]["match"] == "fuzzy"
+
+def test_numbers_must_agree():
+    rows = _rows(
+        ("Govt. Polytechnic College No. 1, Pune", "Pune", "Maharashtra", "", "", "", "", np.nan, np.nan),
+        ("Govt. Polytechnic College No. 2, Pune", "Pune", "Maharashtra", "", "", "", "", np.nan, np.nan),
+    )
+    directory, report = merge_colleges(rows, workers=1, progress=lambda msg: None)
+    assert len(directory) == 2 and report.empty
+
+def test_other_districts_never_merge():
+    rows = _rows(
+        ("Govt. Arts College", "Pune", "Maharashtra", "", "", "", "", np.nan, np.nan),
+        ("Govt. Arts College", "Nagpur", "Maharashtra", "", "", "", "", np.nan, np.nan),
+    )
+    assert len(merge_colleges(rows, workers=1, progress=lambda msg: None)[0]) == 2
+
+def test_synthetic_duplicates_are_found_exactly():
+    rows, truth = synthetic.state_lists(3000, seed=5)
+    rows = rows.assign(source="test.csv", line=np.arange(len(rows)) + 2)
+    directory, report = merge_colleges(rows, workers=1, progress=lambda msg: None)
+    assert len(directory) == len(set(truth))
+    assert (truth[report["line"] - 2] == truth[report["kept_line"] - 2]).all()
+
+def test_read_lists_counts_every_rejected_row(tmp_path):
+    path = tmp_path / "list.csv"
+    pd.DataFrame({"college_name": [f"College {i}" for i in range(1500)], "district": [""] * 1200 + ["Pune"] * 300,
+                  "state": "Maharashtra"}).to_csv(path, index=False)
+    rows, errors, rejected, truncated = read_lists([str(path)], progress=lambda msg: None)
+    assert (len(rows), rejected, len(errors), truncated) == (300, 1200, 1000, True)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from advisor.cutoffs import ANY, CutoffIndex
+from benchmarks import synthetic
+
+def _brute(cutoffs, colleges, rank, category, round_no, year):
+    """{(row, course): closing} from a plain scan, most lenient rank over ANY round/year."""
+    row_of = {(n.strip().lower(), d.strip().lower()): i for i, (n, d) in enumerate(zip(colleges["college_name"], colleges["district"]))}
+    best = {}
+    for r in cutoffs.itertuples(index=False):
+        row = row_of.get((r.college_name.lower(), r.district.lower()))
+        if row is None or r.category != category or round_no not in (ANY, r.round) or year not in (ANY, r.year):
+            continue
+        best[(row, r.course)] = max(best.get((row, r.course), 0), r.closing_rank)
+    return {key: closing for key, closing in best.items() if closing >= rank}
+
+def _eligible(index, *args):
+    rows, course_ids, closing = index.eligible(*args)
+    return {(int(r), index.courses[c]): int(k) for r, c, k in zip(rows, course_ids, closing)}
+
+def test_eligible_matches_a_scan_for_every_round_and_year_combination():
+    colleges = synthetic.colleges(40, seed=3)
+    cutoffs = synthetic.cutoffs(colleges, seed=3)
+    # a row for a college that isn't in the directory is ignored
+    cutoffs.loc[len(cutoffs)] = ["Unknown College", "Nowhere", "BBA", "GEN", 1, 2023, 10**9]
+    index = CutoffIndex(cutoffs, colleges)
+    for rank in (1, 5_000, 40_000, 10**8):
+        for round_no in (ANY, 1, 3):
+            for year in (ANY, 2023, 2024):
+                assert _eligible(index, rank, "OBC", round_no, year) == _brute(cutoffs, colleges, rank, "OBC", round_no, year)
+
+def test_eligible_filters_by_course_and_row_mask():
+    colleges = synthetic.colleges(40, seed=3)
+    index = CutoffIndex(synthetic.cutoffs(colleges, seed=3), colleges)
+    allowed = np.arange(len(colleges)) % 2 == 0
+    got = _eligible(index, 1, "GEN", ANY, ANY, ["BBA", "LLB"], allowed)
+    assert got and all(course in ("BBA", "LLB") and row % 2 == 0 for row, course in got)
+
+def test_by_college_keeps_tightest_course():
+    colleges = pd.DataFrame({"college_name": ["A", "B"], "district": ["X", "Y"]})
+    cutoffs = pd.DataFrame({"college_name": ["A", "A", "B"], "district": ["X", "X", "Y"], "course": ["BBA", "LLB", "BBA"],
+                            "category": "GEN", "round": 1, "year": 2024, "closing_rank": [900, 500, 700]})
+    index = CutoffIndex(cutoffs, colleges)
+    rows, best = index.by_college(*index.eligible(100, "GEN"))
+    assert rows.tolist() == [0, 1] and best.tolist() == [500, 700]
+    assert index.eligible(100, "SC")[0].size == 0
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from advisor.facets import FacetIndex
+
+COLLEGES = pd.DataFrame({
+    "streams": ["Arts,Science", "Humanities", "Fine Arts, Commerce", ""],
+    "courses": ["BA English; B.Sc Physics", "BA History", "BFA", "B.Com"],
+    "facilities": ["Hostel, Library", "Library", "Hostel", None],
+    "state": ["Kerala", "Kerala", "Goa", "Goa"],
+})
+
+def test_values_match_exactly():
+    index = FacetIndex(COLLEGES)
+    assert index.mask({"streams": "Arts"}).tolist() == [True, False, False, False]
+    assert index.mask({"streams": "Humanities"}).tolist() == [False, True, False, False]
+    assert index.mask({"streams": "Fine Arts"}).tolist() == [False, False, True, False]
+
+def test_selections_combine_with_and():
+    index = FacetIndex(COLLEGES)
+    assert index.mask({"state": "Kerala", "facilities": ["Hostel", "Library"]}).tolist() == [True, False, False, False]
+    assert index.mask({"state": "All", "streams": None, "facilities": []}).all()
+    assert not index.mask({"state": "Delhi"}).any()
+
+def test_counts_ignore_the_counted_column():
+    index = FacetIndex(COLLEGES)
+    counts = index.counts("state", {"state": "Kerala", "facilities": ["Hostel"]})
+    assert counts == {"Goa": 1, "Kerala": 1}
+    assert index.counts("state", {"state": "Kerala"}, exclude_self=False) == {"Goa": 0, "Kerala": 2}
+
+def test_round_trips_through_arrays():
+    index = FacetIndex(COLLEGES)
+    copy = FacetIndex.from_arrays(*index.to_arrays())
+    assert copy.mask({"courses": "BFA"}).tolist() == index.mask({"courses": "BFA"}).tolist()
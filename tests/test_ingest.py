@@ -0,0 +1,47 @@
+import io
+
+import pandas as pd
+
+from advisor.ingest import COLLEGE_SCHEMA, TIMELINE_SCHEMA, ingest_csv, validate_chunk
+
+def _csv(text):
+    return pd.read_csv(io.StringIO(text), dtype="string", keep_default_na=False)
+
+def test_validate_chunk_reports_csv_lines_and_messages():
+    chunk = _csv("college_name,district,state,latitude,longitude\n"
+                 "Good College,Pune,Maharashtra,18.5,73.8\n"
+                 "No District,,Kerala,,\n"
+                 "Bad Latitude,Kochi,Kerala,north,76.2\n"
+                 "Off The Map,Kochi,Kerala,95,76.2\n")
+    good, errors = validate_chunk(chunk, COLLEGE_SCHEMA)
+    assert good["college_name"].tolist() == ["Good College"]
+    assert good["latitude"].tolist() == [18.5]
+    assert sorted((e["line"], e["column"], e["error"]) for e in errors) == [
+        (3, "district", "required value is missing"),
+        (4, "latitude", "not a number"),
+        (5, "latitude", "latitude out of range"),
+    ]
+
+def test_validate_chunk_reports_one_error_per_row():
+    chunk = _csv("college_name,district,state,latitude\n,,Kerala,abc\n")
+    good, errors = validate_chunk(chunk, COLLEGE_SCHEMA)
+    assert good.empty and [(e["line"], e["column"]) for e in errors] == [(2, "college_name")]
+
+def test_validate_chunk_parses_dates_and_defaults_end_date():
+    chunk = _csv("event,start_date,end_date,type\n"
+                 "Exam,2025-05-01,,Exam\n"
+                 "Late,2025-05-10,2025-05-01,Exam\n"
+                 "Typo,01/05/2025,,Exam\n")
+    good, errors = validate_chunk(chunk, TIMELINE_SCHEMA)
+    assert good["end_date"].tolist() == [pd.Timestamp("2025-05-01")]
+    assert sorted((e["line"], e["error"]) for e in errors) == [
+        (3, "ends before it starts"), (4, "not a date in %Y-%m-%d format")]
+
+def test_append_reports_current_rows_that_fail(tmp_path):
+    current = pd.DataFrame({"college_name": ["Old College", "Lost College"], "district": ["Pune", ""],
+                            "state": ["Maharashtra", "Kerala"]})
+    upload = io.BytesIO(b"college_name,district,state\nNew College,Goa,Goa\n,Goa,Goa\n")
+    report = ingest_csv(upload, COLLEGE_SCHEMA, str(tmp_path / "colleges.parquet"), base=current)
+    assert (report["written"], report["rejected"]) == (2, 2)
+    assert report["errors"][["source", "line"]].values.tolist() == [["current data", 3], ["upload", 3]]
+    assert pd.read_parquet(tmp_path / "colleges.parquet")["college_name"].tolist() == ["Old College", "New College"]
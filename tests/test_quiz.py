@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from advisor.quiz import QUIZ_MAPPING, QUIZ_QUESTIONS, RESULT_COLUMNS, STREAMS, score_answers, score_codes, score_responses
+
+def _option(q, stream):
+    """Index of question q's option that maps to `stream`."""
+    return next(i for i, o in enumerate(QUIZ_QUESTIONS[q][2]) if QUIZ_MAPPING.get(o) == stream)
+
+def test_score_codes_flags_ties_and_picks_first_stream():
+    science, arts = _option(0, "Science"), _option(1, "Arts/Humanities")
+    codes = np.array([
+        [_option(q, "Commerce") for q in range(5)],                      # clear winner
+        [science, arts, -1, -1, -1],                                    # 1/0/1/0 tie
+        [_option(q, s) for q, s in zip(range(4), STREAMS)] + [-1],      # 1/1/1/1 tie
+        [-1] * 5,                                                      # nothing answered
+    ])
+    scores, best, tied = score_codes(codes)
+    assert scores[0].tolist() == [0, 5, 0, 0]
+    assert [STREAMS[b] for b in best] == ["Commerce", "Science", "Science", "Science"]
+    assert tied.tolist() == [False, True, True, True]
+
+def test_score_answers_matches_batch_scoring():
+    answers = [options[_option(q, "Arts/Humanities")] for q, (_, _, options) in enumerate(QUIZ_QUESTIONS)]
+    scores, best, tied = score_answers(answers)
+    assert best == "Arts/Humanities" and not tied and scores["Arts/Humanities"] == 5
+
+def test_score_responses_reports_ties_and_unknown_answers():
+    responses = pd.DataFrame({"name": ["A", ""], "class": ["Class 12", None],
+                              **{col: [options[_option(q, "Science")], "nonsense"] for q, (col, _, options) in enumerate(QUIZ_QUESTIONS)}})
+    out, unknown, tied = score_responses(responses, timestamp="t")
+    assert list(out.columns) == RESULT_COLUMNS
+    assert out["name"].tolist() == ["A", "Anonymous"] and (unknown, tied) == (5, 1)
+    with_ties, _, _ = score_responses(responses, timestamp="t", with_ties=True)
+    assert with_ties["tied"].tolist() == [False, True]
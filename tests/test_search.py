@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from advisor.search import SearchIndex, tokenize
+
+COLLEGES = pd.DataFrame({
+    "college_name": ["Government Science College", "Govt. Polytechnic, Pune", "St. Xavier's Arts College"],
+    "district": ["Chennai", "Pune", "Thiruvananthapuram"],
+    "courses": ["B.Sc Physics; B.Sc Chemistry", "Diploma Civil", "BA English"],
+})
+
+def test_tokenize_folds_aliases_and_dotted_forms():
+    assert tokenize("Govt. B.Sc, Poona") == ["government", "b", "sc", "pune", "bsc"]
+
+def test_every_term_must_match():
+    index = SearchIndex(COLLEGES)
+    assert index.search("science chennai").tolist() == [0]
+    assert index.search("science pune").tolist() == []
+
+def test_aliases_prefixes_and_typos():
+    index = SearchIndex(COLLEGES)
+    assert sorted(index.search("govt").tolist()) == [0, 1]
+    assert index.search("polytec").tolist() == [1]        # prefix of the last term
+    assert index.search("polytecnic").tolist() == [1]     # trigram fallback
+    assert index.search("tiruvanantapuram").tolist() == [2]  # transliteration variant
+    assert index.search("bsc").tolist() == [0]
+
+def test_name_matches_rank_first_and_empty_query_returns_all():
+    index = SearchIndex(pd.DataFrame({"college_name": ["Arts College", "Pune College"],
+                                      "district": ["Pune", "Nagpur"], "courses": ["", ""]}))
+    assert index.search("pune").tolist() == [1, 0]
+    assert np.array_equal(index.search(""), np.arange(2))
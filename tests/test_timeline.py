@@ -0,0 +1,59 @@
+import io
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from advisor.timeline import TimelineIndex, write_ical
+from benchmarks import synthetic
+
+def _events():
+    df = synthetic.timeline(400, seed=7)
+    df.loc[0, "end_date"] = "2026-12-31"   # one very long event
+    df.loc[1, "end_date"] = ""             # one-day event
+    df.loc[2, "start_date"] = "not a date"  # dropped
+    return df
+
+def _brute(index, first, last, types):
+    t = index.table
+    keep = (t["start_date"] <= last) & (t["end_date"] >= first)
+    if types is not None:
+        keep &= t["type"].isin(types)
+    return np.flatnonzero(keep.to_numpy())
+
+def test_overlapping_and_open_on_match_a_scan():
+    index = TimelineIndex(_events())
+    assert len(index.table) == 399
+    for offset in range(-10, 420, 7):
+        day = date(2025, 1, 1) + timedelta(offset)
+        for types in (None, ["Exam"], ["Scholarship", "Admission"], ["Unknown"]):
+            assert index.open_on(day, types).tolist() == _brute(index, day, day, types).tolist()
+            last = day + timedelta(20)
+            assert index.overlapping(day, last, types).tolist() == _brute(index, day, last, types).tolist()
+
+def test_upcoming_matches_a_scan():
+    index = TimelineIndex(_events())
+    t = index.table
+    for offset in range(0, 400, 23):
+        day = date(2025, 1, 1) + timedelta(offset)
+        for types in (None, ["Exam"], ["Counseling", "Exam/Admission"]):
+            keep = t["start_date"] >= day
+            if types is not None:
+                keep &= t["type"].isin(types)
+            expected = np.flatnonzero(keep.to_numpy())
+            assert index.upcoming(day, types=types).tolist() == expected.tolist()
+            assert index.upcoming(day, n=5, types=types).tolist() == expected[:5].tolist()
+            within = expected[(t["start_date"].to_numpy()[expected] <= day + timedelta(30))]
+            assert index.upcoming(day, within_days=30, types=types).tolist() == within.tolist()
+
+def test_positions_are_in_start_order():
+    index = TimelineIndex(_events())
+    assert (np.diff(index.start) >= 0).all()
+    assert (index.end >= index.start).all()
+
+def test_ical_has_exclusive_all_day_end():
+    events = pd.DataFrame({"event": ["Admissions; round 1"], "start_date": [date(2025, 6, 1)],
+                           "end_date": [date(2025, 6, 30)], "type": ["Admission"]})
+    text = write_ical(events, io.BytesIO()).getvalue().decode()
+    assert "DTSTART;VALUE=DATE:20250601\r\n" in text and "DTEND;VALUE=DATE:20250701\r\n" in text
+    assert "SUMMARY:Admissions\\; round 1\r\n" in text
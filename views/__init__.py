@@ -0,0 +1,4 @@
+# views/__init__.py
+# Streamlit pages. SIH.py imports each page module the first time it is opened,
+# so a session that never visits a page never pays for that page's imports.
+# (Not named pages/: Streamlit would treat that as a multipage app.)
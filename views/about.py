@@ -0,0 +1,18 @@
+# views/about.py
+# About the project.
+
+import streamlit as st
+
+def page_about():
+    st.header("ℹ️ About this Project")
+    st.markdown(
+        """
+        **One-Stop Career & Education Advisor** is a beginner-friendly Streamlit prototype for helping students
+        choose academic streams and plan careers. It is a rules-based guidance tool and a starting point for a larger system.
+        """
+    )
+    st.markdown("**What you can add next (future work):**")
+    st.markdown("- Integrate a full government colleges dataset (with programs & cut-offs).")
+    st.markdown("- Add content packs for more regional languages, and offline features.")
+    st.markdown("- Grow the outcome history behind the similar-students recommender and add stronger psychometrics.")
+    st.markdown("- Integrate an admin panel for counselors to add timelines, college data, and local events.")
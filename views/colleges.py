@@ -0,0 +1,210 @@
+# views/colleges.py
+# Government colleges directory: search, sidebar facets, "near me", rank cut-offs, paging and export.
+
+import hashlib
+
+import numpy as np
+import streamlit as st
+
+from advisor.cutoffs import ANY
+from advisor.ingest import COLLEGE_SCHEMA, CUTOFF_SCHEMA
+from advisor.sorting import COLLEGE_SORTS
+from advisor.sources import COLLEGE_COLUMNS, COLLEGES_PATH, CUTOFF_COLUMNS, CUTOFFS_PATH, GEO_COLUMNS
+from views.common import (college_filters, export_download_button, get_cutoff_index, get_facet_index, get_geo_index,
+                          get_metrics, get_search_index, get_sort_ranks, load_colleges, load_cutoffs, load_pincodes,
+                          render_ingest_form)
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+def college_results(df, version, filters, search, sort_by, near=None, by_rank=None):
+    """Rows for the current filters, search, rank, location and sort.
+
+    `near` is (lat, lon, "Nearest" | "Within distance", k or km). `by_rank` is
+    (cut-off version, rank, category, round, year, course or "All") and keeps
+    colleges with a course that closed at or after that rank, tightest first. The result is
+    kept in session state as a cursor, so paging through it or switching view
+    mode does not re-run the filter, search or geo query.
+    """
+    key = (version, search.strip().lower(), sort_by, near, by_rank,
+           tuple((col, tuple(v) if isinstance(v, list) else v) for col, v in filters.items()))
+    metrics = get_metrics()
+    cursor = st.session_state.get("college_cursor")
+    metrics.inc("cache_requests_total", cache="college_cursor", result="hit" if cursor is not None and cursor["key"] == key else "miss")
+    if cursor is not None and cursor["key"] == key:
+        return cursor
+    with metrics.timed("stage_seconds", stage="filter"):
+        in_view = get_facet_index(df, version).mask(filters)
+    if search.strip():
+        index = get_search_index(df, version)
+        with metrics.timed("stage_seconds", stage="search"):
+            hits = index.search(search)
+        rows = hits[in_view[hits]]
+    else:
+        rows = np.flatnonzero(in_view)
+    eligible = None
+    if by_rank is not None:
+        _, rank, category, round_no, year, course = by_rank
+        index = get_cutoff_index(*load_cutoffs(), df, version)
+        allowed = np.zeros(len(df), dtype=bool)
+        allowed[rows] = True
+        with metrics.timed("stage_seconds", stage="cutoffs"):
+            eligible = index.eligible(rank, category, round_no, year, None if course == "All" else [course], allowed)
+            rows, _ = index.by_college(*eligible)
+    distance = None
+    if near is not None:
+        lat, lon, mode, amount = near
+        allowed = np.zeros(len(df), dtype=bool)
+        allowed[rows] = True
+        geo = get_geo_index(df, version)
+        with metrics.timed("stage_seconds", stage="geo"):
+            if mode == "Nearest":
+                rows, distance = geo.nearest(lat, lon, int(amount), allowed)
+            else:
+                rows, distance = geo.within(lat, lon, float(amount), allowed)
+    if sort_by in COLLEGE_SORTS:
+        rank = get_sort_ranks(df, version)[sort_by]
+        with metrics.timed("stage_seconds", stage="sort"):
+            order = np.argsort(rank[rows], kind="stable")
+        rows = rows[order]
+        distance = None if distance is None else distance[order]
+    cursor = {"key": key, "rows": rows, "distance": distance, "eligible": eligible, "filtered": int(in_view.sum()),
+              "fingerprint": hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()}
+    st.session_state["college_cursor"] = cursor
+    st.session_state["college_page"] = 1
+    return cursor
+
+def eligible_courses(cursor, rows):
+    """"Course (closing rank); ..." for each of `rows` under the cursor's rank query, or None without one."""
+    if cursor["eligible"] is None:
+        return None
+    index = get_cutoff_index(*load_cutoffs(), *load_colleges())
+    return index.describe(*cursor["eligible"], rows)
+
+def render_college_cards(page_df, distance=None, eligible=None):
+    for i, row in enumerate(page_df.itertuples(index=False)):
+        with st.container():
+            c1, c2 = st.columns([4,1])
+            with c1:
+                st.markdown(f"**{row.college_name}** — {row.district}, {row.state}")
+                st.markdown(f"- Streams: {row.streams}")
+                st.markdown(f"- Courses: {row.courses}")
+                st.markdown(f"- Facilities: {row.facilities}")
+                if eligible is not None:
+                    st.markdown(f"- 🎯 Within your rank (closing rank): {eligible[i]}")
+            with c2:
+                st.markdown(f"**Contact**\n{row.contact}")
+                if distance is not None:
+                    st.markdown(f"📍 {distance[i]:.1f} km away")
+            st.markdown("---")
+
+def render_college_table(page_df, distance=None, eligible=None):
+    table = page_df[COLLEGE_COLUMNS]
+    if distance is not None:
+        table = table.assign(distance_km=distance)
+    if eligible is not None:
+        table = table.assign(eligible_courses=eligible)
+    st.dataframe(
+        table,
+        hide_index=True,
+        column_config={
+            "distance_km": st.column_config.NumberColumn("Distance (km)", format="%.1f"),
+            "eligible_courses": st.column_config.TextColumn("Within your rank (closing rank)", width="large"),
+            "college_name": st.column_config.TextColumn("College", width="large"),
+            "district": st.column_config.TextColumn("District"),
+            "state": st.column_config.TextColumn("State"),
+            "streams": st.column_config.TextColumn("Streams"),
+            "courses": st.column_config.TextColumn("Courses", width="large"),
+            "facilities": st.column_config.TextColumn("Facilities"),
+            "contact": st.column_config.TextColumn("Contact"),
+        },
+    )
+
+def page_colleges():
+    st.header("🏛️ Government Colleges Directory (Sample Data)")
+    st.write("This is a demo list. Replace with your state's college dataset (CSV) for production use.")
+    college_data, college_version = load_colleges()
+    # Search box
+    search = st.text_input("Search college name / district / course:")
+    c_sort, c_size, c_mode = st.columns(3)
+    sort_by = c_sort.selectbox("Sort by", ["Relevance"] + list(COLLEGE_SORTS), key="college_sort")
+    page_size = c_size.selectbox("Per page", PAGE_SIZES, index=1, key="college_page_size")
+    view_mode = c_mode.radio("View", ["Cards", "Table"], horizontal=True, key="college_view")
+    near = None
+    with st.expander("📍 Colleges near me"):
+        place = st.text_input("Your district, PIN code or 'lat, lon'", key="near_place")
+        c_near, c_amount = st.columns(2)
+        near_mode = c_near.radio("Show", ["Nearest", "Within distance"], horizontal=True, key="near_mode")
+        if near_mode == "Nearest":
+            amount = c_amount.number_input("How many", min_value=1, max_value=100, value=10, key="near_k")
+        else:
+            amount = c_amount.slider("Distance (km)", min_value=5, max_value=500, value=50, step=5, key="near_km")
+        if place.strip():
+            point = get_geo_index(college_data, college_version).locate(place, load_pincodes())
+            if point is None:
+                st.warning("Couldn't find that place. Try a district name, a 6-digit PIN code or 'lat, lon'.")
+            else:
+                near = (point[0], point[1], near_mode, amount)
+    by_rank = None
+    cutoffs, cutoff_version = load_cutoffs()
+    if cutoffs is not None:
+        with st.expander("🎯 Colleges I can get (by rank)"):
+            cutoff_index = get_cutoff_index(cutoffs, cutoff_version, college_data, college_version)
+            c_rank, c_cat, c_round, c_year = st.columns(4)
+            my_rank = c_rank.number_input("Your rank", min_value=1, value=None, step=1, key="cutoff_rank")
+            category = c_cat.selectbox("Category", cutoff_index.categories, key="cutoff_category")
+            round_no = c_round.selectbox("Round", [ANY] + cutoff_index.rounds, key="cutoff_round",
+                                         format_func=lambda r: "Any round" if r == ANY else f"Round {r}")
+            year = c_year.selectbox("Year", cutoff_index.years + [ANY], key="cutoff_year",
+                                    format_func=lambda y: "Any year" if y == ANY else str(y))
+            course = st.selectbox("Course", ["All"] + cutoff_index.courses, key="cutoff_course")
+            st.caption("Lists courses whose closing rank was at or after yours. 'Any round' / 'Any year' use the most "
+                       "lenient closing rank seen; past cut-offs are a guide, not a guarantee.")
+            if my_rank:
+                by_rank = (cutoff_version, int(my_rank), category, round_no, year, course)
+
+    # filters from sidebar applied (no copy: bitmap masks on the shared directory)
+    cursor = college_results(college_data, college_version, college_filters(), search, sort_by, near, by_rank)
+    rows, distance = cursor["rows"], cursor["distance"]
+    st.markdown(f"**Showing {cursor['filtered']} colleges** (filters applied).")
+    if by_rank is not None:
+        st.caption(f"{len(rows)} colleges with a course within rank {by_rank[1]:,}" +
+                   (", tightest cut-off first." if sort_by == "Relevance" and near is None else "."))
+    if near is not None:
+        st.caption(f"{len(rows)} colleges near {place.strip()}" + (", nearest first." if sort_by == "Relevance" else "."))
+    elif search.strip():
+        st.caption(f"{len(rows)} matches" + (", best first." if sort_by == "Relevance" else "."))
+
+    # display one page as table or cards
+    if len(rows) == 0:
+        st.warning("No colleges found for given filters.")
+    else:
+        n_pages = (len(rows) + page_size - 1) // page_size
+        if st.session_state.get("college_page", 1) > n_pages:
+            st.session_state["college_page"] = n_pages
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key="college_page")
+        start = (page - 1) * page_size
+        page_df = college_data.iloc[rows[start:start + page_size]]
+        page_distance = None if distance is None else distance[start:start + page_size]
+        page_eligible = eligible_courses(cursor, rows[start:start + page_size])
+        st.caption(f"Page {page} of {n_pages} — colleges {start + 1}–{start + len(page_df)} of {len(rows)}")
+        if view_mode == "Table":
+            render_college_table(page_df, page_distance, page_eligible)
+        else:
+            render_college_cards(page_df, page_distance, page_eligible)
+
+        def visible_colleges():
+            table = college_data.iloc[rows][COLLEGE_COLUMNS + GEO_COLUMNS]
+            if cursor["eligible"] is not None:
+                table = table.assign(eligible_courses=eligible_courses(cursor, rows))
+            return table
+        # allow download of all matching colleges (built on click, cached per view)
+        export_download_button("⬇️ Download visible colleges", visible_colleges,
+                               "colleges_filtered", cursor["fingerprint"], key="college_export")
+
+    # allow user to upload their own college CSV
+    st.markdown("### Upload your own colleges CSV (optional)")
+    render_ingest_form("Upload CSV (columns: college_name, state, district, streams, courses, facilities, contact)",
+                       COLLEGE_SCHEMA, COLLEGES_PATH, college_data, key="colleges", publish=load_colleges)
+    st.markdown("### Upload cut-offs CSV (optional)")
+    render_ingest_form(f"Upload CSV (columns: {', '.join(CUTOFF_COLUMNS)})",
+                       CUTOFF_SCHEMA, CUTOFFS_PATH, cutoffs, key="cutoffs")
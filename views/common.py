@@ -0,0 +1,358 @@
+# views/common.py
+# Streamlit glue shared by the pages: cached data and indexes, metrics,
+# download/upload widgets and small HTML helpers. Core logic lives in advisor/;
+# pandas-backed modules are imported inside the cached functions that need them.
+
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from io import BytesIO
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from advisor.content import DEFAULT_LOCALE, content_version, read_content
+from advisor.export import EXPORT_FORMATS, write_export
+from advisor.metrics import BYTES_BUCKETS, COUNT_BUCKETS, METRICS_FLUSH_SECONDS, METRICS_PATH, Metrics
+from advisor.sources import (COLLEGES_PATH, CUTOFFS_PATH, PINCODES_PATH, SHARED_DATA_ENABLED, TIMELINE_PATH, active_source,
+                             source_version, store_path)
+
+# ------------------ STYLES / HELPERS ------------------
+def card(html):
+    st.markdown(html, unsafe_allow_html=True)
+
+def small_pill(text):
+    return f"<span style='background:#eef2ff;border-radius:999px;padding:4px 10px;margin-right:6px;font-size:0.9rem;color:#1e3a8a;border:1px solid #dbeafe'>{text}</span>"
+
+def download_df_as_csv_bytes(df, name="data.csv"):
+    return export_file(df, "CSV"), name
+
+# ------------------ INSTRUMENTATION ------------------
+_cache_state = threading.local()
+
+@st.cache_resource(show_spinner=False)
+def get_metrics():
+    return Metrics()
+
+def instrumented_cache(name, cache=st.cache_resource, **cache_kwargs):
+    """st.cache_resource/st.cache_data that also counts hits and misses and times misses as stage `name`."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def compute(*args, **kwargs):
+            _cache_state.stack[-1] = True  # the body only runs on a miss
+            with get_metrics().timed("stage_seconds", stage=name):
+                return fn(*args, **kwargs)
+        cached = cache(**cache_kwargs)(compute)
+
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            # one marker per call: cached functions called inside this body mark their own
+            stack = _cache_state.__dict__.setdefault("stack", [])
+            stack.append(False)
+            try:
+                result = cached(*args, **kwargs)
+            finally:
+                miss = stack.pop()
+            get_metrics().inc("cache_requests_total", cache=name, result="miss" if miss else "hit")
+            return result
+        call.clear = cached.clear
+        return call
+    return decorate
+
+def _count_payload():
+    """Count the elements (and bytes) this rerun sends to the browser. Returns a callable that stops counting.
+
+    This wraps ScriptRunContext's private _enqueue. If a Streamlit release moves it, the
+    page_elements/page_payload_bytes series stop; payload_hook_missing_total and a one-time
+    warning say so, so a missing series isn't read as zero traffic.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None:  # not running under Streamlit
+        return lambda: None
+    enqueue = getattr(ctx, "_enqueue", None)
+    if not callable(enqueue):
+        get_metrics().inc("payload_hook_missing_total")
+        if not getattr(_count_payload, "warned", False):
+            _count_payload.warned = True
+            logging.getLogger(__name__).warning("ScriptRunContext._enqueue not found: page payload metrics are off")
+        return lambda: None
+    tally = [0, 0]
+
+    def counting(msg):
+        if msg.HasField("delta"):
+            tally[0] += 1
+            tally[1] += msg.ByteSize()
+        enqueue(msg)
+    ctx._enqueue = counting
+
+    def stop():
+        ctx._enqueue = enqueue
+        return tally
+    return stop
+
+@contextmanager
+def instrument_page(name):
+    """Time one page render and record reruns and payload size for it."""
+    metrics = get_metrics()
+    if "reruns" not in st.session_state:
+        st.session_state["reruns"] = 0
+        metrics.inc("sessions_total")
+    st.session_state["reruns"] += 1
+    metrics.inc("reruns_total", page=name)
+    stop_counting = _count_payload()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe("page_seconds", time.perf_counter() - start, page=name)
+        tally = stop_counting()
+        if tally:
+            metrics.observe("page_elements", tally[0], buckets=COUNT_BUCKETS, page=name)
+            metrics.observe("page_payload_bytes", tally[1], buckets=BYTES_BUCKETS, page=name)
+        metrics.maybe_flush()
+
+def debug_panel_enabled():
+    """Operators only: the panel shows pids, cache ratios and file paths, so no URL switch turns it on."""
+    return os.environ.get("ADVISOR_DEBUG_PANEL") == "1"
+
+def render_debug_panel():
+    import pandas as pd
+    snap = get_metrics().snapshot()
+    with st.sidebar.expander("⏱️ Performance (debug)", expanded=True):
+        st.caption(f"This session: {st.session_state.get('reruns', 0)} reruns · pid {snap['pid']}")
+        rows = []
+        for h in snap["histograms"]:
+            scale = 1e3 if h["name"].endswith("_seconds") else 1
+            rows.append({"metric": h["name"], "labels": ", ".join(f"{k}={v}" for k, v in h["labels"].items()),
+                         "count": h["count"], "mean": round(h["sum"] / max(h["count"], 1) * scale, 2),
+                         "p50": Metrics.quantile(h, 0.5) * scale, "p95": Metrics.quantile(h, 0.95) * scale})
+        if rows:
+            st.dataframe(pd.DataFrame(rows), hide_index=True)
+            st.caption("Times in ms; p50/p95 are histogram bucket bounds.")
+        caches = {}
+        for c in snap["counters"]:
+            if c["name"] == "cache_requests_total":
+                caches.setdefault(c["labels"]["cache"], {"hit": 0, "miss": 0})[c["labels"]["result"]] += c["value"]
+        if caches:
+            st.dataframe(pd.DataFrame([{"cache": k, **v, "hit_ratio": round(v["hit"] / max(v["hit"] + v["miss"], 1), 3)}
+                                       for k, v in sorted(caches.items())]), hide_index=True)
+        if METRICS_PATH:
+            st.caption(f"Writing to {METRICS_PATH} every {METRICS_FLUSH_SECONDS:.0f}s")
+
+# ------------------ EXPORT ------------------
+# Exports are encoded chunk by chunk, only when a download is clicked, and kept
+# per view fingerprint so repeat downloads of the same view cost nothing. The
+# bytes are immutable, so they're cached as a resource and every hit shares one
+# object instead of unpickling a fresh copy.
+def _encode(df, fmt):
+    with write_export(df, fmt, BytesIO()) as buf:
+        return buf.getvalue()  # the buffer is released on return, leaving one bytes object
+
+@instrumented_cache("export", show_spinner=False, max_entries=16, ttl=3600)
+def _cached_export(fingerprint, fmt, _make_df):
+    return _encode(_make_df(), fmt)
+
+def export_file(df, fmt, fingerprint=None):
+    """Encoded bytes of `df` (or a callable returning it), shared by downloads with the same fingerprint."""
+    if fingerprint is None:
+        return _encode(df() if callable(df) else df, fmt)
+    return _cached_export(fingerprint, fmt, df if callable(df) else (lambda: df))
+
+def export_download_button(label, make_df, base_name, fingerprint, key):
+    """Format picker + download button; the file is only built when the button is clicked."""
+    c_fmt, c_btn = st.columns([1,3])
+    fmt = c_fmt.selectbox("Format", list(EXPORT_FORMATS), key=f"{key}_fmt", label_visibility="collapsed")
+    ext, mime = EXPORT_FORMATS[fmt]
+    c_btn.download_button(label, data=lambda: export_file(make_df, fmt, fingerprint),
+                          file_name=f"{base_name}.{ext}", mime=mime, key=key)
+
+# ------------------ DATA LOADING ------------------
+# The college directory and timeline are read once per source version and shared
+# by every session. With shared snapshots on (the default), they are mapped from
+# advisor.shared snapshots instead, which also carry the prebuilt indexes, so
+# every worker process on the node shares one copy.
+def _snapshot(dataset, version):
+    """Open shared snapshot for `version`, or None when snapshots are off."""
+    if not SHARED_DATA_ENABLED:
+        return None
+    from advisor.shared import opened
+    return opened(dataset, version)
+
+@instrumented_cache("load_colleges", show_spinner="Loading college directory...", max_entries=2)
+def _load_colleges(path, version):
+    from advisor.data import read_colleges
+    if SHARED_DATA_ENABLED:
+        from advisor.shared import open_snapshot
+        return open_snapshot("colleges", version, lambda: read_colleges(path)).frame
+    return read_colleges(path)
+
+def load_colleges(path=COLLEGES_PATH):
+    """Shared, read-only college directory and its version. Reloads only when the source file changes."""
+    path = active_source(path)
+    version = source_version(path)
+    return _load_colleges(path, version), version
+
+@instrumented_cache("load_timeline", show_spinner=False, max_entries=2)
+def _load_timeline(path, version):
+    from advisor.data import read_timeline
+    if SHARED_DATA_ENABLED:
+        from advisor.shared import open_snapshot
+        return open_snapshot("timeline", version, lambda: read_timeline(path)).frame
+    return read_timeline(path)
+
+def load_timeline(path=TIMELINE_PATH):
+    """Shared, read-only timeline events and their version."""
+    path = active_source(path)
+    version = source_version(path)
+    return _load_timeline(path, version), version
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_pincodes(path, version):
+    from advisor.data import read_pincodes
+    return read_pincodes(path)
+
+def load_pincodes(path=PINCODES_PATH):
+    """PIN code -> (lat, lon); empty when no PIN gazetteer is installed."""
+    if not os.path.exists(path):
+        return {}
+    return _load_pincodes(path, source_version(path))
+
+@instrumented_cache("load_cutoffs", show_spinner=False, max_entries=2)
+def _load_cutoffs(path, version):
+    from advisor.data import read_cutoffs
+    return read_cutoffs(path)
+
+def load_cutoffs(path=CUTOFFS_PATH):
+    """Shared closing-rank table and its version; (None, None) when no cut-offs are installed."""
+    path = active_source(path)
+    if not os.path.exists(path):
+        return None, None
+    version = source_version(path)
+    return _load_cutoffs(path, version), version
+
+# ------------------ CONTENT ------------------
+# Each locale's pack is parsed on first use and shared by every session until
+# its file (or the default pack it falls back to) changes on disk.
+@instrumented_cache("load_content", show_spinner=False, max_entries=32)
+def _load_content(locale, version):
+    return read_content(locale)
+
+def current_locale():
+    return st.session_state.get("locale", DEFAULT_LOCALE)
+
+def load_content(locale=None):
+    """Shared, read-only content pack for `locale` (default: the sidebar's language)."""
+    locale = locale or current_locale()
+    return _load_content(locale, content_version(locale))
+
+# ------------------ INDEXES ------------------
+@instrumented_cache("search_index", show_spinner="Indexing colleges...", max_entries=2)
+def get_search_index(_df, version):
+    snapshot = _snapshot("colleges", version)
+    if snapshot is not None:
+        return snapshot.indexes["search"]
+    from advisor.search import SearchIndex
+    return SearchIndex(_df)
+
+@instrumented_cache("facet_index", show_spinner=False, max_entries=2)
+def get_facet_index(_df, version):
+    snapshot = _snapshot("colleges", version)
+    if snapshot is not None:
+        return snapshot.indexes["facets"]
+    from advisor.facets import FacetIndex
+    return FacetIndex(_df)
+
+@instrumented_cache("geo_index", show_spinner=False, max_entries=2)
+def get_geo_index(_df, version):
+    snapshot = _snapshot("colleges", version)
+    if snapshot is not None:
+        return snapshot.indexes["geo"]
+    from advisor.geo import GeoIndex
+    return GeoIndex(_df)
+
+@instrumented_cache("timeline_index", show_spinner=False, max_entries=2)
+def get_timeline_index(_df, version):
+    from advisor.timeline import TimelineIndex
+    return TimelineIndex(_df)
+
+@instrumented_cache("sort_ranks", show_spinner=False, max_entries=2)
+def get_sort_ranks(_df, version):
+    snapshot = _snapshot("colleges", version)
+    if snapshot is not None:
+        return snapshot.indexes["sort_ranks"]
+    from advisor.sorting import sort_ranks
+    return sort_ranks(_df)
+
+@instrumented_cache("cutoff_index", show_spinner="Indexing cut-offs...", max_entries=2)
+def get_cutoff_index(_cutoffs, cutoff_version, _colleges, college_version):
+    from advisor.cutoffs import CutoffIndex
+    return CutoffIndex(_cutoffs, _colleges)
+
+# ------------------ QUIZ RESULTS ------------------
+@st.cache_resource(show_spinner=False)
+def get_result_writer():
+    """Process-wide background writer for the quiz-result store."""
+    from advisor.results import ResultWriter
+    return ResultWriter()
+
+@instrumented_cache("recommender", show_spinner=False, max_entries=2)
+def _load_recommender(path, version, roadmaps_version):
+    from advisor.recommender import StreamRecommender, read_outcomes
+    return StreamRecommender(read_outcomes(path), load_content(DEFAULT_LOCALE)["roadmaps"])
+
+def load_recommender():
+    """Shared stream recommender built from the outcome history; None when no history is installed."""
+    from advisor.recommender import OUTCOMES_PATH
+    path = active_source(OUTCOMES_PATH)
+    if not os.path.exists(path):
+        return None
+    # rebuilt when the history or the default locale's roadmaps (its path names) change
+    return _load_recommender(path, source_version(path), content_version(DEFAULT_LOCALE))
+
+# ------------------ SIDEBAR FILTERS ------------------
+def college_filters():
+    """The sidebar's current filter picks, read from session state so pages can use them before the sidebar draws."""
+    return {
+        "streams": st.session_state.get("filter_stream", "All"),
+        "state": st.session_state.get("filter_state", "All"),
+        "courses": st.session_state.get("filter_course", "All"),
+        "facilities": st.session_state.get("filter_facilities", []),
+    }
+
+# ------------------ INGESTION ------------------
+def render_ingest_form(label, schema, source_path, current, key, publish=None):
+    """Uploader + import button shared by the directory and timeline pages.
+
+    `publish` (e.g. load_colleges) runs right after a successful import, so the
+    new version's shared snapshot is built once here rather than by the next
+    worker to notice it.
+    """
+    from advisor.ingest import ingest_csv
+    uploaded = st.file_uploader(label, type=["csv"], key=f"{key}_upl")
+    if uploaded:
+        mode = st.radio("Import mode", ["Append to current data", "Replace current data"], horizontal=True, key=f"{key}_mode")
+        if st.button("Validate & import", key=f"{key}_go"):
+            bar = st.progress(0.0, text="Reading upload...")
+            try:
+                report = ingest_csv(uploaded, schema, store_path(source_path),
+                                    base=current if mode.startswith("Append") else None,
+                                    progress=lambda frac, text: bar.progress(frac, text=text))
+            except Exception as e:
+                st.error(f"Import failed, nothing was changed: {e}")
+            else:
+                if publish is not None:
+                    bar.progress(1.0, text="Publishing the new version...")
+                    publish()
+                bar.progress(1.0, text="Done")
+                st.session_state[f"{key}_report"] = report
+    report = st.session_state.get(f"{key}_report")
+    if report:
+        st.success(f"Imported {report['written']:,} rows into the app data ({report['rejected']:,} rows rejected). "
+                   "Other pages pick up the new version on their next run.")
+        if not report["errors"].empty:
+            st.dataframe(report["errors"], hide_index=True)
+            csv_bytes, fname = download_df_as_csv_bytes(report["errors"], name=f"{key}_import_errors.csv")
+            st.download_button("⬇️ Download error report", data=csv_bytes, file_name=fname, mime="text/csv", key=f"{key}_errors")
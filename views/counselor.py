@@ -0,0 +1,50 @@
+# views/counselor.py
+# Counselor dashboard: suggested-stream distribution by class and by district,
+# read from the result store's precomputed aggregate tables.
+
+import pandas as pd
+import streamlit as st
+
+from advisor.quiz import STREAMS
+from advisor.results import RESULTS_DB_PATH, read_store
+from views.common import get_result_writer
+
+def stream_table(counts, top=None):
+    """{key: {stream: n}} -> one row per key, one column per stream plus Total, largest first."""
+    table = pd.DataFrame.from_dict(counts, orient="index").reindex(columns=STREAMS).fillna(0).astype("int64")
+    table["Total"] = table.sum(axis=1)
+    table = table.sort_values(["Total"], ascending=False, kind="stable")
+    return table if top is None else table.head(top)
+
+def page_counselor():
+    st.header("📊 Counselor Dashboard")
+    st.write("Suggested streams from submitted quizzes, by class and by district. Counts update as students submit.")
+    writer = get_result_writer()
+    store = read_store(RESULTS_DB_PATH)
+    if store is None:
+        st.info("No quiz results yet. Results appear here once students submit the quiz.")
+        return
+    try:
+        total = store.total()
+        by_class = store.stream_counts("student_class")
+        by_district = store.stream_counts("district")
+    finally:
+        store.close()
+    c_total, c_pending, c_dropped = st.columns(3)
+    c_total.metric("Quiz results", f"{total:,}")
+    c_pending.metric("Waiting to be saved", f"{writer.pending():,}")
+    c_dropped.metric("Not saved (queue full / errors)", f"{writer.dropped + writer.failed:,}")
+    if not total:
+        return
+
+    tab_class, tab_district = st.tabs(["By class", "By district"])
+    with tab_class:
+        table = stream_table(by_class)
+        st.bar_chart(table[STREAMS])
+        st.dataframe(table)
+    with tab_district:
+        top = st.slider("Districts to show", min_value=5, max_value=100, value=20, step=5, key="counselor_top")
+        table = stream_table(by_district, top)
+        st.bar_chart(table[STREAMS])
+        st.dataframe(table)
+        st.caption(f"{len(by_district):,} districts in total; students who left it blank are counted as 'Unknown'.")
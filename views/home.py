@@ -0,0 +1,21 @@
+# views/home.py
+# Landing page.
+
+import streamlit as st
+
+from views.common import card
+
+def page_home():
+    st.header("Welcome Student 👋")
+    st.write(
+        "Use this portal to: take an aptitude quiz, view expanded course-to-career roadmaps, "
+        "search a sample directory of government colleges, track important admissions/exam timelines, and access study resources."
+    )
+    # Three feature cards
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        card(f"<div style='padding:12px; border-radius:8px; background:#f8fafc;'><h3>🧠 Quiz</h3><p>Quick aptitude quiz that suggests a stream.</p></div>")
+    with c2:
+        card(f"<div style='padding:12px; border-radius:8px; background:#f8fafc;'><h3>📈 Career Roadmaps</h3><p>Detailed degree → entrance → jobs → higher studies pathways.</p></div>")
+    with c3:
+        card(f"<div style='padding:12px; border-radius:8px; background:#f8fafc;'><h3>🏛️ Colleges & Timeline</h3><p>Sample government colleges directory + admission timelines.</p></div>")
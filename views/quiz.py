@@ -0,0 +1,85 @@
+# views/quiz.py
+# Aptitude & interest quiz. Scoring lives in advisor/quiz.py.
+
+import numpy as np
+import streamlit as st
+
+from advisor.content import content_version
+from advisor.quiz import CLASS_OPTIONS, QUIZ_QUESTIONS, STREAMS, result_frame, score_answers
+from advisor.results import result_row
+from views.common import (current_locale, export_file, get_metrics, get_result_writer, instrumented_cache, load_content,
+                          load_recommender)
+
+@instrumented_cache("quiz_result", st.cache_data, show_spinner=False, max_entries=1024)
+def render_quiz_result(answers, locale, version):
+    """Score an answer tuple and draw the suggestion + roadmap; replayed from cache for repeat answer sets.
+
+    Keyed by locale and content version too, so an edited or translated roadmap is never replayed stale.
+    """
+    scores, best, _ = score_answers(list(answers))
+    # tie-handling (if equal scores)
+    if len(set(scores.values())) == 1:  # all equal
+        st.info("Your interests span multiple streams. Consider exploring small projects in each to decide.")
+    st.success(f"✅ Suggested Stream: **{best}**")
+    # show expanded roadmap for chosen stream
+    st.markdown("---")
+    st.subheader(f"📚 Expanded Roadmap: {best}")
+    data = load_content(locale)["roadmaps"][best]
+    st.write(data["summary"])
+    for p in data["paths"]:
+        st.markdown(f"**{p['degree']}**  \nEntrance: {p['entrance']}  \nFirst roles: {p['first_roles']}  \nHigher studies: {p['higher']}  \nFuture: {p['future']}")
+        st.markdown("---")
+    st.markdown("**Key skills to build:** " + ", ".join(data["skills"]))
+    return scores, best
+
+def render_similar_students(answers, student_class, marks):
+    """Streams and paths taken by past students with similar answers, class and marks."""
+    recommender = load_recommender()
+    if recommender is None:
+        return
+    with get_metrics().timed("stage_seconds", stage="recommend"):
+        result = recommender.recommend(answers, student_class, marks)
+    st.subheader("🤝 What students like you went on to study")
+    st.caption(f"Based on the {result['neighbours']} most similar of {recommender.n_students:,} past students"
+               + ("" if marks is not None else " (add your marks for a closer match)") + ".")
+    for stream, confidence in result["streams"][:3]:
+        st.progress(confidence, text=f"{stream} — {confidence:.0%}")
+    st.markdown("**Paths they took:**")
+    for stream, degree, confidence in result["paths"][:5]:
+        st.markdown(f"- {degree} *({stream})* — {confidence:.0%}")
+
+def page_quiz():
+    st.header("🧠 Aptitude & Interest Quiz")
+    st.write("Answer honestly. The recommendation is rules-based and meant to guide your next steps — not decide your future.")
+    # one form, so changing an answer doesn't rerun the app until it is submitted
+    with st.form("quiz_form"):
+        # Collect some basic info
+        name = st.text_input("Name (optional)")
+        student_class = st.selectbox("Current class/grade", CLASS_OPTIONS, index=2)
+        district = st.text_input("District (optional, helps your school counselor)")
+        marks = st.number_input("Marks in your last exam, % (optional)", min_value=0, max_value=100, value=None, step=1)
+
+        st.markdown("---")
+        st.subheader("Quiz Questions")
+        # questions (expanded); scoring rules live in advisor/quiz.py
+        answers = tuple(st.radio(question, options, index=0) for _, question, options in QUIZ_QUESTIONS)
+        submitted = st.form_submit_button("🔎 Suggest my Stream")
+
+    if submitted:
+        st.session_state["quiz_submission"] = (name, student_class, answers, marks)
+        # recorded once per submission, by the background writer
+        scores, best, _ = score_answers(list(answers))
+        get_result_writer().submit(result_row(name, student_class, district, scores, best))
+    # keep showing the last result across reruns (e.g. after the download click)
+    submission = st.session_state.get("quiz_submission")
+    if submission:
+        name, student_class, answers, marks = submission
+        locale = current_locale()
+        scores, best = render_quiz_result(answers, locale, content_version(locale))
+        render_similar_students(answers, student_class, marks)
+        # download result (CSV), built on click so the page itself doesn't need pandas
+        st.download_button("⬇️ Download my result (CSV)",
+                           data=lambda: export_file(result_frame([name], [student_class], np.array([list(scores.values())]),
+                                                                 np.array([STREAMS.index(best)])), "CSV"),
+                           file_name="career_quiz_result.csv", mime="text/csv")
+        st.info("Tip: Try small online courses or internships to validate the suggested stream.")
@@ -0,0 +1,21 @@
+# views/resources.py
+# Study resources, FAQs and career tips.
+
+import streamlit as st
+
+from views.common import load_content
+
+def page_resources_faqs():
+    content = load_content()
+    st.header("📚 Study Resources & Scholarships")
+    st.write("Curated list of free and official resources to help you get started.")
+    for r in content["study_resources"]:
+        st.markdown(f"**{r['title']}** — *{r['type']}*  \n{r['note']}  \nLink: {r['link']}")
+    st.markdown("---")
+    st.header("❓ Frequently Asked Questions")
+    for question, answer in content["faqs"]:
+        with st.expander(question):
+            st.write(answer)
+    st.markdown("### Quick Career Tips")
+    for t in content["career_tips"]:
+        st.markdown(f"- {t}")
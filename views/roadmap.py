@@ -0,0 +1,32 @@
+# views/roadmap.py
+# Course → career roadmaps by stream.
+
+import streamlit as st
+
+from views.common import load_content, small_pill
+
+def page_roadmap():
+    st.header("📈 Course → Career Roadmaps (Explore by Stream)")
+    roadmaps = load_content()["roadmaps"]
+    stream_pick = st.selectbox("Choose a stream", list(roadmaps.keys()))
+    r = roadmaps[stream_pick]
+    st.write(r["summary"])
+    st.markdown("**Paths & Examples**")
+    for item in r["paths"]:
+        st.markdown(f"### {item['degree']}")
+        col_a, col_b = st.columns([2,1])
+        with col_a:
+            st.markdown(f"- **Entrance:** {item['entrance']}")
+            st.markdown(f"- **First Job Roles:** {item['first_roles']}")
+            st.markdown(f"- **Higher Studies:** {item['higher']}")
+            st.markdown(f"- **Future Scope:** {item['future']}")
+        with col_b:
+            st.markdown(small_pill("Skills"))
+            st.write(", ".join(r["skills"]))
+        st.markdown("---")
+    st.markdown("**Practical advice:**")
+    st.write(
+        "- Start small: online course or project in the area you like.  "
+        "- Document your work: a portfolio helps more than a single test score.  "
+        "- Talk to seniors and teachers in that subject."
+    )
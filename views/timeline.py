@@ -0,0 +1,54 @@
+# views/timeline.py
+# Admissions, exams and scholarships timeline with calendar export.
+
+from datetime import date
+
+import streamlit as st
+
+from advisor.ingest import TIMELINE_SCHEMA
+from advisor.sources import TIMELINE_PATH
+from advisor.timeline import iter_ical
+from views.common import get_timeline_index, load_timeline, render_ingest_form
+
+def page_timeline():
+    st.header("📅 Timeline Tracker — Admissions, Exams & Scholarships")
+    timeline_data, timeline_version = load_timeline()
+    # dates are parsed and sorted once per timeline version
+    index = get_timeline_index(timeline_data, timeline_version)
+    today = date.today()
+    c_type, c_days = st.columns([2,1])
+    types = c_type.multiselect("Event types", index.types, key="timeline_types") or None
+    horizon = c_days.number_input("Upcoming within (days)", min_value=1, max_value=3650, value=90, key="timeline_days")
+
+    # highlight what is open now and the next upcoming event
+    open_now = index.table.iloc[index.open_on(today, types)]
+    if not open_now.empty:
+        st.markdown("**Open now**")
+        for row in open_now.head(20).itertuples(index=False):
+            st.markdown(f"- **{row.event}** — until {row.end_date} ({row.type})")
+    upcoming = index.table.iloc[index.upcoming(today, within_days=horizon, types=types)]
+    if not upcoming.empty:
+        next_event = upcoming.iloc[0]
+        st.success(f"Next Important: **{next_event['event']}** on {next_event['start_date']}"
+                   + (f" (+{len(upcoming) - 1} more in the next {horizon} days)" if len(upcoming) > 1 else ""))
+    else:
+        st.info("No upcoming events in the demo timeline. Add more events via code or CSV upload.")
+
+    # show events overlapping the chosen range, sorted by start_date
+    if len(index.table):
+        first, last = index.table["start_date"].iloc[0], index.table["end_date"].max()
+        picked = st.date_input("Show events between", value=(first, last), key="timeline_range")
+        if len(picked) == 2:
+            first, last = picked
+        shown = index.table.iloc[index.overlapping(first, last, types)]
+        st.dataframe(shown, hide_index=True)
+        # st.download_button needs the whole payload, so the calendar is built on click as
+        # one string from the line generator, and Streamlit encodes it once
+        st.download_button("📆 Add these events to my calendar (.ics)",
+                           data=lambda: "".join(iter_ical(shown)),
+                           file_name="timeline.ics", mime="text/calendar")
+
+    # allow upload of timeline CSV
+    st.markdown("### Upload timeline CSV (optional)")
+    render_ingest_form("CSV columns: event,start_date(YYYY-MM-DD),end_date,type",
+                       TIMELINE_SCHEMA, TIMELINE_PATH, timeline_data, key="timeline", publish=load_timeline)